@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import httpx
 import asyncio
 import logging 
@@ -26,6 +26,26 @@ class ServiceClient:
         self.service_name = service_name
         self.settings = config.get("retry", {})
         self.timeout = httpx.Timeout(self.settings.get("service_timeout", 30))
+        # Connection counts default to httpx's own; idle connections are kept for a minute
+        # (httpx drops them after 5s) so they stay warm between tool calls
+        self.limits = httpx.Limits(
+            max_connections=self.settings.get("max_connections", 100),
+            max_keepalive_connections=self.settings.get("max_keepalive_connections", 20),
+            keepalive_expiry=self.settings.get("keepalive_expiry", 60)
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client, creating it on first use so connections are kept alive between calls."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=self.limits)
+        return self._client
+    
+    async def aclose(self):
+        """Close the pooled HTTP client and its open connections."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
         
     async def _request(
         self,
@@ -73,10 +93,9 @@ class ServiceClient:
         
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.request(method, url, **kwargs)
-                    response.raise_for_status()
-                    return response.json()
+                response = await self._get_client().request(method, url, **kwargs)
+                response.raise_for_status()
+                return response.json()
             except httpx.HTTPStatusError as e:
                 # Don't retry client errors (4xx) - they won't succeed on retry
                 if 400 <= e.response.status_code < 500:
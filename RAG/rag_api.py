@@ -1,3 +1,4 @@
+import os
 import uuid
 from fastapi import FastAPI, HTTPException, status, Depends, Query
 from fastapi.responses import JSONResponse
@@ -13,6 +14,7 @@ from RAG.jwt_utils import get_current_user, verify_token
 from RAG.context import current_jwt_token, current_jwt_token_string
 from fastapi import Request, Response
 from RAG.rag_service import RAGService
+from RAG.tools import warmup_clients, close_clients
 from RAG.rag_service_pydantic_models import *
 from VectorStore.vectorstore_pydantic_models import HealthCheckResponseModel 
 
@@ -36,6 +38,8 @@ async def lifespan(app: FastAPI):
     try:
         rag = RAGService()
         await rag.initialize()
+        if os.getenv("WARMUP_SERVICE_CLIENTS", "false").lower() == "true":
+            await warmup_clients()
         logger.info("RAG Service API started successfully")
         yield
     except Exception as e:
@@ -46,6 +50,7 @@ async def lifespan(app: FastAPI):
         logger.info("Shutting down RAG Service API...")
         if rag:
             await rag.close()
+        await close_clients()
         logger.info("RAG Service API shut down successfully")
 
 
@@ -642,6 +642,12 @@ class RAGService:
     async def close(self):
         """Clean up resources before shutting down the service."""
         logger.info("Cleaning up RAGService resources.")
+        await asyncio.gather(
+            self.cache_api.aclose(),
+            self.chat_api.aclose(),
+            self.vectorstore_api.aclose(),
+            self.user_api.aclose()
+        )
         self.agent = None
         self.summary_model = None
         self._initialized = False
@@ -1,9 +1,16 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
 
 class PineconeSearchInput(BaseModel):
     query: str = Field(description="The search query for the vector database.")
+    source_file: Optional[str] = Field(
+        default=None,
+        description="Optional document name taken from a previous result's 'sources' to search only within that document."
+    )
+
+class PineconeBatchSearchInput(BaseModel):
+    queries: List[str] = Field(description="Several independent search queries for the vector database.")
 
 class GetChatMessagesResponseModel(BaseModel):
     message_id: str
@@ -1,17 +1,23 @@
 import json
 import os
+import asyncio
+import functools
+import time
 import httpx
 from dotenv import load_dotenv
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from langchain.tools import tool
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
-from RAG.utils import load_config
-from RAG.rag_service_pydantic_models import PineconeSearchInput
+from RAG.utils import load_config, QueryCache
+from RAG.rag_service_pydantic_models import PineconeSearchInput, PineconeBatchSearchInput
 # from RAG.context import current_jwt_token
 from RAG.client import ServiceClient
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import logging
 load_dotenv()
 
@@ -23,30 +29,144 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 CONFIG = load_config()
+USER_NAME = CONFIG['user'].get('name')
+
+# Read once at import; these do not change for the lifetime of the process
+VECTORSTORE_SERVICE_URL = os.getenv("VECTORSTORE_SERVICE_URL")
+PINECONE_TOP_K = CONFIG['pinecone'].get('top_k', 10)
+PINECONE_NAMESPACE = CONFIG['pinecone'].get('namespace', None)
+# The agent runs a step's tool calls concurrently; bound how many searches hit the VectorStore at once
+MAX_CONCURRENT_SEARCHES = CONFIG['pinecone'].get('max_concurrent_searches', 8)
+SEARCH_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+
+# Upper bound on the context handed back to the LLM, split evenly across retrieved chunks
+MAX_CONTEXT_CHARS = CONFIG['pinecone'].get('max_context_chars', 16384)
+
+# Repeated queries are answered from memory instead of another VectorStore round trip
+QUERY_CACHE = QueryCache(
+    max_size=CONFIG['pinecone'].get('query_cache', {}).get('max_size', 512),
+    ttl=CONFIG['pinecone'].get('query_cache', {}).get('ttl_seconds', 300)
+)
+
+# Frequent questions fetched into QUERY_CACHE in the background on the first tool call, and again once they expire
+PREWARM_QUERIES = tuple(CONFIG['pinecone'].get('prewarm_queries', []))
+_prewarm_task: Optional[asyncio.Task] = None
+_prewarm_started = 0.0
+
+
+@functools.lru_cache(maxsize=1)
+def get_vectorstore_client() -> ServiceClient:
+    """Get the VectorStore service client, created once and reused by every tool call."""
+    return ServiceClient(
+        base_url=VECTORSTORE_SERVICE_URL,
+        service_name="VectorStoreService",
+        config=CONFIG
+    )
+
+
+async def reset_clients() -> None:
+    """Close and drop the cached service clients so the next call builds new ones (used by tests)."""
+    await close_clients()
+    get_vectorstore_client.cache_clear()
+
+
+async def warmup_clients() -> None:
+    """Open the VectorStore keep-alive connection ahead of the first tool call."""
+    if await get_vectorstore_client().health_check():
+        logger.info("[Tool Clients: VectorStore connection warmed up]")
+
+
+async def close_clients() -> None:
+    """Close the pooled connections held by the cached service clients."""
+    if get_vectorstore_client.cache_info().currsize:
+        await get_vectorstore_client().aclose()
+
+
+def _schedule_prewarm() -> None:
+    """
+    Start prewarming the query cache, unless a run is in flight or its entries are still fresh.
+    
+    Runs from tool calls rather than at startup because VectorStore requests
+    need the caller's JWT, which create_task carries over in the context.
+    """
+    global _prewarm_task, _prewarm_started
+    if not PREWARM_QUERIES:
+        return
+    if _prewarm_task is not None and (not _prewarm_task.done() or time.monotonic() - _prewarm_started < QUERY_CACHE.ttl):
+        return
+    _prewarm_started = time.monotonic()
+    _prewarm_task = asyncio.create_task(prewarm())
+
+
+async def prewarm() -> None:
+    """Run PREWARM_QUERIES through retrieve_personal_info concurrently to populate QUERY_CACHE."""
+    await asyncio.gather(*(retrieve_personal_info.coroutine(query) for query in PREWARM_QUERIES))
+    logger.info("[Tool Clients: Prewarmed %d queries]", len(PREWARM_QUERIES))
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize to compact JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# Queries shorter than this cannot match anything useful, so they skip the VectorStore call
+MIN_QUERY_LENGTH = 3
+EMPTY_JSON = _dumps({"context": "", "sources": [], "error": "Query too short."})
+EMPTY_RESULT_JSON = _dumps({"context": "", "sources": [], "error": "No relevant documents found."})
+
+
+def _format_results(results: List[Dict[str, Any]]) -> str:
+    """Serialize VectorStore search results into the compact {context, sources} JSON the agent expects."""
+    if not results:
+        return EMPTY_RESULT_JSON
+
+    per_doc_budget = MAX_CONTEXT_CHARS // len(results)
+    payload = {
+        "context": "\n------\n".join(result.get("content", "")[:per_doc_budget] for result in results),
+        # Several chunks usually come from the same file; list each source once, in rank order
+        "sources": list(dict.fromkeys(result.get("metadata", {}).get("source_file", "unknown") for result in results)),
+    }
+    return _dumps(payload)
+
+
+def _cache_key(query: str, source_file: Optional[str] = None) -> tuple:
+    """Build the QUERY_CACHE key for a search query."""
+    return (PINECONE_NAMESPACE, PINECONE_TOP_K, source_file, query.strip().lower())
+
 
 @tool(
     args_schema=PineconeSearchInput,
-    description=f"Searches a personal vector database containing documents about {CONFIG['user'].get('name')}. Use this to find info on {CONFIG['user'].get('name')}'s resume, skills, project reports, and other professional or personal information."
+    description="Searches a personal vector database containing documents about {name}. Use this to find info on {name}'s resume, skills, project reports, and other professional or personal information.".format(name=USER_NAME)
 )
-async def retrieve_personal_info(query: str) -> str:
+async def retrieve_personal_info(query: str, source_file: Optional[str] = None) -> str:
     """Retrieve personal information from vector database."""
+    _schedule_prewarm()
+
+    if len(query.strip()) < MIN_QUERY_LENGTH:
+        return EMPTY_JSON
+
+    cache_key = _cache_key(query, source_file)
+    cached = QUERY_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug('[Tool Call: Served cached results for query: "%s"]', query)
+        return cached
+
     try:
         # jwt_token = current_jwt_token.get()
         # headers = {"Authorization": f"Bearer {jwt_token}"} if jwt_token else {}
 
         # pinecone_service_url = os.getenv("PINECONE_SERVICE_URL")
 
-        service_client = ServiceClient(
-            base_url=os.getenv("VECTORSTORE_SERVICE_URL"),
-            service_name="VectorStoreService",
-            config=CONFIG
-        )
+        service_client = get_vectorstore_client()
 
         payload = {
             "query": query,
-            "top_k": CONFIG['pinecone'].get('top_k', 10),
-            "namespace": CONFIG['pinecone'].get('namespace', None),
-            
+            "top_k": PINECONE_TOP_K,
+            "namespace": PINECONE_NAMESPACE,
+            # Pinecone applies metadata filters during the ANN search, so fewer candidates are scanned
+            "filter": {"source_file": source_file} if source_file else None,
         }
         # with httpx.Client(timeout=CONFIG['retry'].get('service_timeout', 30)) as client:
         #     response = client.post(
@@ -58,30 +178,33 @@ async def retrieve_personal_info(query: str) -> str:
         #     response.raise_for_status()
         #     result = response.json()
 
-        result = await service_client.post("/vectorstore/search", json=payload)
+        async with SEARCH_SEMAPHORE:
+            result = await service_client.post("/vectorstore/search", json=payload)
 
-        logger.info(f'[Tool Call: Retrieved {len(result.get("results", []))} results from Pinecone for query: "{query}"]')
+        logger.debug('[Tool Call: Retrieved %d results from Pinecone for query: "%s"]', len(result.get("results", [])), query)
 
-        return json.dumps(result.get("results", []))
+        serialized = _format_results(result.get("results", []))
+        QUERY_CACHE.set(cache_key, serialized)
+        return serialized
 
     except httpx.HTTPError as e:
-        logger.error(f'[Tool Call: HTTP error accessing Pinecone service: {str(e)}]')
-        return json.dumps({
+        logger.error('[Tool Call: HTTP error accessing Pinecone service: %s]', e)
+        return _dumps({
             "success": False,
             "error": f"HTTP error accessing Pinecone service: {str(e)}"
         })
     except Exception as e:
-        logger.error(f'[Tool Call: Error accessing vector store: {str(e)}]')
-        return json.dumps({
+        logger.error('[Tool Call: Error accessing vector store: %s]', e)
+        return _dumps({
             "success": False,
             "error": f"Error accessing vector store: {str(e)}"
         })
 
-retrieve_personal_info.__doc__ = f"""
-        Searches a personal vector database containing documents about {CONFIG['user'].get('name')}. 
-        Use this to find info on {CONFIG['user'].get('name')}'s resume, skills, project reports, and other professional or personal information.
+retrieve_personal_info.__doc__ = """
+        Searches a personal vector database containing documents about {name}. 
+        Use this to find info on {name}'s resume, skills, project reports, and other professional or personal information.
         
-        IMPORTANT: ONLY use this tool when the user asks specific questions about {CONFIG['user'].get('name')}'s:
+        IMPORTANT: ONLY use this tool when the user asks specific questions about {name}'s:
         - Professional experience, work history, or employment
         - Projects, research, or technical work
         - Skills, qualifications, or education
@@ -95,12 +218,73 @@ retrieve_personal_info.__doc__ = f"""
         - Workspace/project structure (use get_workspace_structure instead)
         
         Args:
-            query: The specific information to search for (e.g., 'What projects has {CONFIG['user'].get('name')} worked on?').
+            query: The specific information to search for (e.g., 'What projects has {name} worked on?').
+            source_file: Optional document name from a previous result's 'sources' to narrow the search to that document.
 
         Returns:
-            A JSON string containing retrieved documents and metadata.
-    """
+            A JSON string with the retrieved 'context' and the list of 'sources'.
+    """.format(name=USER_NAME)
+
+
+@tool(
+    args_schema=PineconeBatchSearchInput,
+    description="Runs several independent searches over the personal vector database about {name} in one call. Use this instead of repeated retrieve_personal_info calls when a question needs information on multiple distinct topics.".format(name=USER_NAME)
+)
+async def retrieve_personal_info_batch(queries: List[str]) -> str:
+    """Retrieve personal information for several queries with one VectorStore request."""
+    _schedule_prewarm()
+
+    results: List[Optional[str]] = [
+        EMPTY_JSON if len(query.strip()) < MIN_QUERY_LENGTH else QUERY_CACHE.get(_cache_key(query))
+        for query in queries
+    ]
+    missing = [i for i, cached in enumerate(results) if cached is None]
+
+    if not missing:
+        logger.debug('[Tool Call: Served cached results for %d queries]', len(queries))
+        return "[" + ",".join(results) + "]"
+
+    try:
+        service_client = get_vectorstore_client()
+
+        payload = {
+            "queries": [queries[i] for i in missing],
+            "top_k": PINECONE_TOP_K,
+            "namespace": PINECONE_NAMESPACE,
+        }
+
+        async with SEARCH_SEMAPHORE:
+            response = await service_client.post("/vectorstore/search/batch", json=payload)
+
+        for i, search_response in zip(missing, response.get("results", [])):
+            serialized = _format_results(search_response.get("results", []))
+            QUERY_CACHE.set(_cache_key(queries[i]), serialized)
+            results[i] = serialized
+
+        logger.debug('[Tool Call: Retrieved results from Pinecone for %d of %d queries]', len(missing), len(queries))
+
+        # Each entry is already serialized JSON, so stitch the array together directly
+        return "[" + ",".join(r if r is not None else EMPTY_RESULT_JSON for r in results) + "]"
+
+    except httpx.HTTPError as e:
+        logger.error('[Tool Call: HTTP error accessing Pinecone service: %s]', e)
+        error = _dumps({
+            "success": False,
+            "error": f"HTTP error accessing Pinecone service: {str(e)}"
+        })
+    except Exception as e:
+        logger.error('[Tool Call: Error accessing vector store: %s]', e)
+        error = _dumps({
+            "success": False,
+            "error": f"Error accessing vector store: {str(e)}"
+        })
+
+    # Keep one entry per query so the output still lines up with the inputs
+    return "[" + ",".join(r if r is not None else error for r in results) + "]"
+
+# Built once; callers receive the same immutable sequence
+_TOOLS = (retrieve_personal_info, retrieve_personal_info_batch)
 
-def get_tools() -> List:
-    """Get the list of available tools."""
-    return [retrieve_personal_info]
\ No newline at end of file
+def get_tools() -> Tuple:
+    """Get the available tools."""
+    return _TOOLS
\ No newline at end of file
@@ -1,9 +1,12 @@
-from typing import Dict, Any
+from typing import Dict, Any, Hashable, Optional
 import yaml
 import pathlib
 import os
 import httpx
 import asyncio
+import time
+import threading
+from collections import OrderedDict
 from dotenv import load_dotenv
 
 
@@ -23,4 +26,60 @@ def load_config(config_path: str = None) -> Dict:
         with open(config_path, "r") as file:
             config = yaml.safe_load(file)
         
-        return config
\ No newline at end of file
+        return config
+
+
+class QueryCache:
+    """Thread-safe LRU cache with a per-entry TTL for serialized tool results."""
+    
+    def __init__(self, max_size: int = 512, ttl: float = 300.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_size: Maximum number of entries kept before evicting the least recently used
+            ttl: Seconds an entry stays valid after it was stored
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[str]:
+        """Return the cached value for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: str) -> None:
+        """Store value under key, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop every entry, e.g. after documents were ingested or deleted."""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,129 @@
+"""
+Persistent embedding cache for the VectorStore service.
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, List
+
+from langchain_core.embeddings import Embeddings
+
+logger = logging.getLogger(__name__)
+
+# Stay well under SQLite's limit on bound parameters per statement
+_LOOKUP_BATCH_SIZE = 500
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that keeps computed vectors in a local SQLite file.
+
+    Vectors are keyed by SHA-256 of the model name, the embedding kind
+    (query or document) and the text, and stored as float32 blobs, so they
+    survive restarts and never collide across models or task types. Once the
+    table grows past `max_entries` the oldest vectors are dropped.
+    """
+
+    def __init__(self, embeddings: Embeddings, model_name: str, path: str, max_entries: int = 100_000):
+        """
+        Initialize the cache.
+
+        Args:
+            embeddings: Embedding model used on cache misses
+            model_name: Name of that model, part of every cache key
+            path: SQLite file to store vectors in
+            max_entries: Maximum number of vectors kept in the file
+        """
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.max_entries = max_entries
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            # Searches write from the request threadpool; WAL lets readers proceed during a write
+            # and NORMAL sync skips the fsync per commit (a crash can only lose recent cache rows)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+            self._conn.commit()
+            self._size = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+        logger.info(f"Embedding cache enabled at {path}")
+
+    def __getattr__(self, name):
+        # Forward provider attributes such as embedding_dimension to the wrapped model
+        if name == "embeddings":
+            raise AttributeError(name)
+        return getattr(self.embeddings, name)
+
+    def _key(self, kind: str, text: str) -> bytes:
+        """Build the cache key for a text embedded as `kind`."""
+        return hashlib.sha256(f"{self.model_name}\0{kind}\0{text}".encode("utf-8")).digest()
+
+    def _lookup(self, keys: List[bytes]) -> Dict[bytes, List[float]]:
+        """Fetch the cached vectors for `keys`; missing keys are absent from the result."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+                batch = keys[start:start + _LOOKUP_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array('f')
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+        return found
+
+    def _store(self, items: Dict[bytes, List[float]]) -> None:
+        """Persist freshly computed vectors, dropping the oldest ones beyond max_entries."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (hash, vec) VALUES (?, ?)",
+                [(key, array('f', vector).tobytes()) for key, vector in items.items()]
+            )
+            self._size += len(items)
+            if self._size > self.max_entries:
+                # Recount only when the estimate crosses the bound; rowids grow with insertion order
+                excess = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] - self.max_entries
+                if excess > 0:
+                    self._conn.execute(
+                        "DELETE FROM embeddings WHERE rowid IN (SELECT rowid FROM embeddings ORDER BY rowid LIMIT ?)",
+                        (excess,)
+                    )
+                self._size = self.max_entries + min(excess, 0)
+            self._conn.commit()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed documents, only calling the wrapped model for texts not cached yet."""
+        keys = [self._key("document", text) for text in texts]
+        found = self._lookup(list(dict.fromkeys(keys)))
+
+        # Deduplicate misses so repeated chunks are embedded once
+        missing = {key: text for key, text in zip(keys, texts) if key not in found}
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            self._store(computed)
+            found.update(computed)
+
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a query, serving it from the cache when it was seen before."""
+        key = self._key("query", text)
+        found = self._lookup([key])
+        if key in found:
+            return found[key]
+
+        vector = self.embeddings.embed_query(text)
+        self._store({key: vector})
+        return vector
@@ -5,6 +5,7 @@ from typing import Dict, Optional
 from fastapi import FastAPI, HTTPException, status, Depends, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from VectorStore.vectorstore_service import PineconeService
 from VectorStore.vectorstore_pydantic_models import *
 from VectorStore.jwt_utils import get_current_user
@@ -501,7 +502,9 @@ async def search_vector_store(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials"
             )
-        results = pinecone_service.search(
+        # Embedding and Pinecone calls block, so keep them off the event loop
+        results = await run_in_threadpool(
+            pinecone_service.search,
             query=request.query,
             top_k=request.top_k,
             namespace=request.namespace,
@@ -531,6 +534,67 @@ async def search_vector_store(
         )
 
 
+@app.post(
+    "/vectorstore/search/batch",
+    status_code=status.HTTP_200_OK,
+    summary="Batch search vector store",
+    response_description="Batch search completed successfully",
+    response_model=BatchSearchResponseModel,
+    tags=["Search"]
+)
+async def batch_search_vector_store(
+    request: BatchSearchRequestModel,
+    current_user: Dict = Depends(get_current_user)
+):
+    """Search for similar documents for several queries, embedding each query and running the lookups concurrently."""
+    if not pinecone_service:
+        logger.error("VectorStore service not initialized")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="VectorStore service not initialized"
+        )
+    
+    try:
+        user_id = current_user.get("user_id")
+        if not user_id:
+            logger.error("User ID not found in token payload")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials"
+            )
+        batch_results = await run_in_threadpool(
+            pinecone_service.search_batch,
+            queries=request.queries,
+            top_k=request.top_k,
+            namespace=request.namespace,
+            filter=request.filter
+        )
+        
+        responses = []
+        for query, results in zip(request.queries, batch_results):
+            results_list = [
+                SearchResultModel(
+                    content=doc.page_content,
+                    metadata=doc.metadata
+                )
+                for doc in results
+            ]
+            responses.append(SearchResponseModel(
+                results=results_list,
+                total_results=len(results_list),
+                query=query
+            ))
+        
+        return BatchSearchResponseModel(results=responses)
+        
+    except Exception as e:
+        logger.error(f"Error batch searching vector store: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to search vector store: {str(e)}"
+        )
+
+
 # ============================================================================
 # NAMESPACE MANAGEMENT ENDPOINTS
 # ============================================================================
@@ -645,7 +709,8 @@ async def root():
                 "POST /vectorstore/ingest"
             ],
             "search": [
-                "POST /vectorstore/search"
+                "POST /vectorstore/search",
+                "POST /vectorstore/search/batch"
             ],
             "namespace_management": [
                 "DELETE /vectorstore/namespace/{namespace}"
@@ -57,6 +57,19 @@ class SearchResponseModel(BaseModel):
     query: str = Field(..., description="Original search query")
 
 
+class BatchSearchRequestModel(BaseModel):
+    """Request model for searching Pinecone with several queries"""
+    queries: List[str] = Field(..., min_length=1, description="Search query texts")
+    top_k: Optional[int] = Field(None, description="Number of results to return per query")
+    namespace: Optional[str] = Field(None, description="Optional namespace to search in")
+    filter: Optional[Dict[str, Any]] = Field(None, description="Optional metadata filter")
+
+
+class BatchSearchResponseModel(BaseModel):
+    """Response model for batch search results"""
+    results: List[SearchResponseModel] = Field(..., description="Search results, one entry per query in request order")
+
+
 class DeleteNamespaceRequestModel(BaseModel):
     """Request model for deleting namespace"""
     namespace: str = Field(..., description="Namespace to delete")
@@ -13,11 +13,13 @@ from dotenv import load_dotenv
 import requests
 import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from VectorStore.utils import load_config
 from VectorStore.jwt_utils import *
 from VectorStore.document_loader import DocumentLoaderFactory
+from VectorStore.embedding_cache import CachedEmbeddings
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
@@ -51,7 +53,7 @@ class PineconeService:
         self.aws_secret_access_key = os.getenv("AWS_SECRET_ACCESS_KEY")
         
         self.client = PineconeClient(api_key=self.pinecone_api_key)
-        self.embedding_model = self._embedding_model()
+        self.embedding_model = self._with_embedding_cache(self._embedding_model())
 
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=self.config['chunking']['chunk_size'],
@@ -71,6 +73,7 @@ class PineconeService:
             logger.warning(f"Could not initialize S3 client: {e}. S3 features will not work.")
             self.s3_client = None
 
+        self.use_grpc = self.config['pinecone'].get('use_grpc', False)
         self.vector_store = None
         self._initialize_vector_store()
 
@@ -99,14 +102,52 @@ class PineconeService:
                 model=model_config['name'],
                 api_key=api_key
             )
+        elif model_config.get('provider') == 'local':
+            # Runs on this machine, so no API key or network hop; needs `pip install sentence-transformers`.
+            # The index must be built with the same model, so switching providers means re-ingesting.
+            try:
+                from langchain_huggingface import HuggingFaceEmbeddings
+            except ImportError:
+                # Deprecated location, used when langchain-huggingface is not installed
+                from langchain_community.embeddings import HuggingFaceEmbeddings
+            
+            return HuggingFaceEmbeddings(
+                model_name=model_config['name'],
+                model_kwargs={"device": "cpu", **model_config.get('model_kwargs', {})},
+                encode_kwargs={"normalize_embeddings": True}
+            )
+    
+    def _with_embedding_cache(self, embedding_model):
+        """Wrap the embedding model in a persistent cache when enabled in config"""
+        cache_config = self.config.get('embedding_cache', {})
+        if not cache_config.get('enabled', False) or os.getenv("DISABLE_EMBEDDING_CACHE", "false").lower() == "true":
+            return embedding_model
+        
+        return CachedEmbeddings(
+            embedding_model,
+            model_name=self.config['models']['embedding']['name'],
+            path=cache_config.get('path', '.cache/embeddings.sqlite'),
+            max_entries=cache_config.get('max_entries', 100_000)
+        )
     
     def _initialize_vector_store(self):
         """Initialize the Pinecone vector store connection"""
         try:
-            self.vector_store = PineconeVectorStore(
-                index_name=self.pinecone_index_name,
-                embedding=self.embedding_model
-            )
+            if self.use_grpc:
+                # Requires `pip install "pinecone[grpc]"`; queries share one HTTP/2
+                # connection and responses are decoded from protobuf instead of JSON
+                from pinecone.grpc import PineconeGRPC
+                
+                index = PineconeGRPC(api_key=self.pinecone_api_key).Index(self.pinecone_index_name)
+                self.vector_store = PineconeVectorStore(
+                    index=index,
+                    embedding=self.embedding_model
+                )
+            else:
+                self.vector_store = PineconeVectorStore(
+                    index_name=self.pinecone_index_name,
+                    embedding=self.embedding_model
+                )
             logger.info(f"Pinecone vector store initialized for index: {self.pinecone_index_name}")
         except Exception as e:
             logger.error(f"Error initializing Pinecone vector store: {e}")
@@ -334,9 +375,13 @@ class PineconeService:
             
             # Ingest into Pinecone
             logger.info(f"Ingesting {len(chunks)} chunks into Pinecone")
+            # The gRPC index answers async upserts with concurrent futures, which
+            # langchain-pinecone cannot wait on (no .get()), so upsert synchronously
+            upsert_kwargs = {"async_req": False} if self.use_grpc else {}
             self.vector_store.add_documents(
                 documents=chunks,
-                namespace=namespace
+                namespace=namespace,
+                **upsert_kwargs
             )
             
             logger.info(
@@ -636,6 +681,44 @@ class PineconeService:
         except Exception as e:
             logger.error(f"Error searching Pinecone: {e}")
             raise
+    
+    def search_batch(
+        self,
+        queries: List[str],
+        top_k: int = None,
+        namespace: Optional[str] = None,
+        filter: Optional[Dict] = None
+    ) -> List[List[Document]]:
+        """
+        Search Pinecone for several queries at once.
+        
+        Each query is embedded with embed_query, like search(), so batch and
+        single searches return the same neighbours; the per-query embedding
+        and Pinecone lookups run concurrently.
+        
+        Returns:
+            One list of documents per query, in the same order as `queries`
+        """
+        if not queries:
+            return []
+        
+        if top_k is None:
+            top_k = self.config['pinecone'].get('top_k', 10)
+        
+        try:
+            def _search(query: str) -> List[Document]:
+                return self.vector_store.similarity_search_by_vector(
+                    self.embedding_model.embed_query(query),
+                    k=top_k,
+                    namespace=namespace,
+                    filter=filter
+                )
+            
+            with ThreadPoolExecutor(max_workers=min(4, len(queries))) as executor:
+                return list(executor.map(_search, queries))
+        except Exception as e:
+            logger.error(f"Error batch searching Pinecone: {e}")
+            raise
 
     def delete_namespace(self, namespace: str) -> bool:
         """Delete all vectors in a namespace."""
@@ -4,7 +4,6 @@ Pytest configuration and fixtures for ChatService tests.
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch, Mock
-import os
 import tempfile
 import yaml
 from pathlib import Path
@@ -54,8 +53,7 @@ def temp_config_file():
     yield temp_path
     
     # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    Path(temp_path).unlink(missing_ok=True)
 
 
 @pytest.fixture
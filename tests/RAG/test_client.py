@@ -0,0 +1,70 @@
+"""
+Tests for the pooled ServiceClient.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from RAG.client import ServiceClient
+
+
+@pytest.fixture
+def async_client_cls():
+    """Patch httpx.AsyncClient so every instance answers requests with an empty JSON body."""
+    def build(**kwargs):
+        client = MagicMock()
+        client.is_closed = False
+        client.request = AsyncMock(return_value=MagicMock(json=MagicMock(return_value={"status": "ok"})))
+        client.aclose = AsyncMock()
+        return client
+
+    with patch('RAG.client.httpx.AsyncClient', side_effect=build) as cls:
+        yield cls
+
+
+@pytest.fixture
+def service_client():
+    """ServiceClient with no pool limits configured."""
+    return ServiceClient(base_url="http://vectorstore:8000/", service_name="VectorStoreService", config={})
+
+
+class TestServiceClient:
+    """Tests for ServiceClient connection pooling."""
+
+    def test_default_limits(self, service_client):
+        """Test unconfigured connection counts match httpx's defaults and idle connections live for a minute."""
+        assert service_client.limits.max_connections == 100
+        assert service_client.limits.max_keepalive_connections == 20
+        assert service_client.limits.keepalive_expiry == 60
+
+    def test_configured_limits(self):
+        """Test pool limits can be set under retry in config."""
+        client = ServiceClient(
+            base_url="http://vectorstore:8000",
+            service_name="VectorStoreService",
+            config={"retry": {"max_connections": 4, "max_keepalive_connections": 2, "keepalive_expiry": 30}}
+        )
+
+        assert (client.limits.max_connections, client.limits.max_keepalive_connections) == (4, 2)
+        assert client.limits.keepalive_expiry == 30
+
+    async def test_requests_reuse_one_client(self, service_client, async_client_cls):
+        """Test consecutive requests share one pooled AsyncClient."""
+        await service_client.get("/health", requires_auth=False)
+        await service_client.post("/vectorstore/search", requires_auth=False, json={})
+
+        async_client_cls.assert_called_once()
+        assert service_client._client.request.await_count == 2
+        assert service_client._client.request.call_args[0] == ("POST", "http://vectorstore:8000/vectorstore/search")
+
+    async def test_aclose_resets_client(self, service_client, async_client_cls):
+        """Test aclose closes the pooled client and the next request opens a new one."""
+        await service_client.get("/health", requires_auth=False)
+        pooled = service_client._client
+
+        await service_client.aclose()
+
+        pooled.aclose.assert_awaited_once()
+        assert service_client._client is None
+
+        await service_client.get("/health", requires_auth=False)
+        assert async_client_cls.call_count == 2
+        assert service_client._client is not pooled
@@ -0,0 +1,197 @@
+"""
+Tests for the RAG agent tools.
+"""
+import json
+import pytest
+import httpx
+from unittest.mock import AsyncMock, MagicMock, patch
+from RAG import tools
+
+
+@pytest.fixture
+def vectorstore_client():
+    """Mock VectorStore service client returned by get_vectorstore_client."""
+    client = MagicMock()
+    client.post = AsyncMock(return_value={"results": []})
+    with patch('RAG.tools.get_vectorstore_client', return_value=client), \
+         patch('RAG.tools._prewarm_task', None), \
+         patch('RAG.tools.PREWARM_QUERIES', ()):
+        tools.QUERY_CACHE.clear()
+        yield client
+        tools.QUERY_CACHE.clear()
+
+
+def search_result(content, source_file=None):
+    """Build one VectorStore search result."""
+    metadata = {"source_file": source_file} if source_file else {}
+    return {"content": content, "metadata": metadata}
+
+
+class TestFormatResults:
+    """Tests for _format_results."""
+
+    def test_joins_chunks_with_separator(self):
+        """Test chunk contents are joined in rank order with the separator."""
+        output = json.loads(tools._format_results([search_result("first", "a.pdf"), search_result("second", "b.pdf")]))
+
+        assert output == {"context": "first\n------\nsecond", "sources": ["a.pdf", "b.pdf"]}
+
+    def test_truncates_each_chunk_to_even_share(self):
+        """Test each chunk is cut to MAX_CONTEXT_CHARS // len(results)."""
+        with patch('RAG.tools.MAX_CONTEXT_CHARS', 10):
+            output = json.loads(tools._format_results([search_result("a" * 8), search_result("b" * 3)]))
+
+        assert output["context"] == "aaaaa\n------\nbbb"
+
+    def test_dedupes_sources_in_rank_order(self):
+        """Test each source file is listed once, in the order it first appears."""
+        results = [search_result("1", "b.pdf"), search_result("2", "a.pdf"), search_result("3", "b.pdf")]
+
+        assert json.loads(tools._format_results(results))["sources"] == ["b.pdf", "a.pdf"]
+
+    def test_missing_source_is_unknown(self):
+        """Test results without a source_file are reported as 'unknown'."""
+        output = json.loads(tools._format_results([{"content": "x"}, search_result("y")]))
+
+        assert output["sources"] == ["unknown"]
+
+    def test_empty_results_payload(self):
+        """Test no results return the precomputed empty payload."""
+        assert tools._format_results([]) is tools.EMPTY_RESULT_JSON
+        assert json.loads(tools.EMPTY_RESULT_JSON) == {
+            "context": "", "sources": [], "error": "No relevant documents found."
+        }
+
+
+class TestRetrievePersonalInfo:
+    """Tests for retrieve_personal_info."""
+
+    async def test_repeated_query_served_from_cache(self, vectorstore_client):
+        """Test a repeated query does not call the VectorStore again."""
+        vectorstore_client.post.return_value = {"results": [search_result("Worked at Acme", "resume.pdf")]}
+
+        first = await tools.retrieve_personal_info.coroutine("Work experience")
+        second = await tools.retrieve_personal_info.coroutine("  work EXPERIENCE ")
+
+        assert first == second
+        assert json.loads(first)["sources"] == ["resume.pdf"]
+        vectorstore_client.post.assert_awaited_once()
+
+    async def test_failed_call_not_cached(self, vectorstore_client):
+        """Test an error response is returned but not cached."""
+        vectorstore_client.post.side_effect = [httpx.ConnectError("down"), {"results": []}]
+
+        failed = await tools.retrieve_personal_info.coroutine("work experience")
+        retried = await tools.retrieve_personal_info.coroutine("work experience")
+
+        assert json.loads(failed)["success"] is False
+        assert retried == tools.EMPTY_RESULT_JSON
+        assert vectorstore_client.post.await_count == 2
+
+    async def test_short_query_skips_search(self, vectorstore_client):
+        """Test queries under MIN_QUERY_LENGTH return EMPTY_JSON without a request."""
+        assert await tools.retrieve_personal_info.coroutine(" a ") == tools.EMPTY_JSON
+        vectorstore_client.post.assert_not_awaited()
+
+    async def test_source_file_filter(self, vectorstore_client):
+        """Test source_file becomes a metadata filter and is cached separately from unfiltered searches."""
+        await tools.retrieve_personal_info.coroutine("work experience", source_file="resume.pdf")
+        filtered_payload = vectorstore_client.post.call_args[1]["json"]
+        await tools.retrieve_personal_info.coroutine("work experience")
+        unfiltered_payload = vectorstore_client.post.call_args[1]["json"]
+
+        assert filtered_payload["filter"] == {"source_file": "resume.pdf"}
+        assert unfiltered_payload["filter"] is None
+        assert vectorstore_client.post.await_count == 2
+
+        await tools.retrieve_personal_info.coroutine("work experience", source_file="resume.pdf")
+        assert vectorstore_client.post.await_count == 2
+
+
+class TestRetrievePersonalInfoBatch:
+    """Tests for retrieve_personal_info_batch."""
+
+    async def test_merges_cached_and_fetched_results(self, vectorstore_client):
+        """Test only uncached queries are sent and results stay in input order."""
+        tools.QUERY_CACHE.set(tools._cache_key("skills"), '"cached"')
+        vectorstore_client.post.return_value = {"results": [
+            {"results": [search_result("Acme", "resume.pdf")]},
+            {"results": [search_result("Thesis", "thesis.pdf")]},
+        ]}
+
+        output = json.loads(await tools.retrieve_personal_info_batch.coroutine(
+            ["work experience", "skills", "ab", "education"]
+        ))
+
+        assert vectorstore_client.post.call_args[1]["json"]["queries"] == ["work experience", "education"]
+        assert output[0]["sources"] == ["resume.pdf"]
+        assert output[1] == "cached"
+        assert output[2] == json.loads(tools.EMPTY_JSON)
+        assert output[3]["sources"] == ["thesis.pdf"]
+        assert tools.QUERY_CACHE.get(tools._cache_key("education")) == tools._dumps(output[3])
+
+    async def test_short_response_fills_empty_results(self, vectorstore_client):
+        """Test queries without a matching response entry get the empty-results payload."""
+        vectorstore_client.post.return_value = {"results": [{"results": [search_result("Acme", "resume.pdf")]}]}
+
+        output = json.loads(await tools.retrieve_personal_info_batch.coroutine(["work experience", "education"]))
+
+        assert len(output) == 2
+        assert output[0]["sources"] == ["resume.pdf"]
+        assert output[1] == json.loads(tools.EMPTY_RESULT_JSON)
+
+    async def test_error_keeps_one_entry_per_query(self, vectorstore_client):
+        """Test a failed request returns an error object in every uncached slot."""
+        tools.QUERY_CACHE.set(tools._cache_key("skills"), '"cached"')
+        vectorstore_client.post.side_effect = httpx.ConnectError("down")
+
+        output = json.loads(await tools.retrieve_personal_info_batch.coroutine(["work experience", "skills"]))
+
+        assert len(output) == 2
+        assert output[0]["success"] is False
+        assert output[1] == "cached"
+        assert tools.QUERY_CACHE.get(tools._cache_key("work experience")) is None
+
+
+class TestPrewarm:
+    """Tests for prewarming the query cache."""
+
+    async def test_prewarm_fills_query_cache(self, vectorstore_client):
+        """Test prewarm stores a result for every PREWARM_QUERIES entry."""
+        with patch('RAG.tools.PREWARM_QUERIES', ("work experience", "education")):
+            await tools.prewarm()
+
+        assert vectorstore_client.post.await_count == 2
+        assert tools.QUERY_CACHE.get(tools._cache_key("education")) == tools.EMPTY_RESULT_JSON
+
+    async def test_scheduled_once_until_entries_expire(self, vectorstore_client):
+        """Test later tool calls do not prewarm again until the cached entries have expired."""
+        with patch('RAG.tools.PREWARM_QUERIES', ("work experience",)), \
+             patch('RAG.tools.prewarm', AsyncMock()) as prewarm, \
+             patch('RAG.tools._prewarm_started', 0.0):
+            await tools.retrieve_personal_info.coroutine("education")
+            await tools._prewarm_task
+            await tools.retrieve_personal_info.coroutine("skills")
+            assert prewarm.await_count == 1
+
+            tools._prewarm_started -= tools.QUERY_CACHE.ttl
+            await tools.retrieve_personal_info.coroutine("projects")
+            await tools._prewarm_task
+            assert prewarm.await_count == 2
+
+
+class TestClients:
+    """Tests for the cached VectorStore client helpers."""
+
+    @patch('RAG.tools.VECTORSTORE_SERVICE_URL', 'http://vectorstore:8000')
+    async def test_reset_clients_closes_pooled_client(self):
+        """Test reset_clients closes the cached client before dropping it."""
+        await tools.reset_clients()
+        client = tools.get_vectorstore_client()
+
+        with patch.object(client, 'aclose', AsyncMock()) as aclose:
+            await tools.reset_clients()
+
+        aclose.assert_awaited_once()
+        assert tools.get_vectorstore_client() is not client
+        await tools.reset_clients()
@@ -0,0 +1,81 @@
+"""
+Tests for the QueryCache used by the RAG tools.
+"""
+import pytest
+from unittest.mock import patch
+from RAG.utils import QueryCache
+
+
+@pytest.fixture
+def clock():
+    """Controllable stand-in for time.monotonic."""
+    with patch('RAG.utils.time.monotonic', return_value=1000.0) as monotonic:
+        yield monotonic
+
+
+class TestQueryCache:
+    """Tests for QueryCache."""
+
+    def test_get_missing_counts_miss(self, clock):
+        """Test a lookup of an unknown key returns None and counts a miss."""
+        cache = QueryCache(max_size=2, ttl=10)
+
+        assert cache.get("missing") is None
+        assert (cache.hits, cache.misses) == (0, 1)
+
+    def test_set_then_get_counts_hit(self, clock):
+        """Test a stored value is returned and counted as a hit."""
+        cache = QueryCache(max_size=2, ttl=10)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_entry_expires_after_ttl(self, clock):
+        """Test an entry is served until its TTL passes, then dropped."""
+        cache = QueryCache(max_size=2, ttl=10)
+        cache.set("key", "value")
+
+        clock.return_value = 1010.0
+        assert cache.get("key") == "value"
+
+        clock.return_value = 1010.5
+        assert cache.get("key") is None
+        assert len(cache) == 0
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self, clock):
+        """Test the least recently used entry is evicted once max_size is exceeded."""
+        cache = QueryCache(max_size=2, ttl=10)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+        assert cache.evictions == 1
+
+    def test_set_existing_key_refreshes_ttl(self, clock):
+        """Test storing a key again restarts its TTL without evicting anything."""
+        cache = QueryCache(max_size=2, ttl=10)
+        cache.set("key", "old")
+
+        clock.return_value = 1008.0
+        cache.set("key", "new")
+        clock.return_value = 1015.0
+
+        assert cache.get("key") == "new"
+        assert cache.evictions == 0
+
+    def test_clear(self, clock):
+        """Test clear drops every entry."""
+        cache = QueryCache(max_size=2, ttl=10)
+        cache.set("a", "1")
+        cache.set("b", "2")
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get("a") is None
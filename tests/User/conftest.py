@@ -5,7 +5,6 @@ import pytest
 import asyncio
 import asyncpg
 from unittest.mock import AsyncMock, MagicMock, patch
-import os
 import tempfile
 import yaml
 from pathlib import Path
@@ -48,8 +47,7 @@ def temp_config_file():
     yield temp_path
     
     # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    Path(temp_path).unlink(missing_ok=True)
 
 
 @pytest.fixture
@@ -70,6 +68,13 @@ def mock_connection():
     return conn
 
 
+@pytest.fixture
+def wired_pool(mock_db_pool, mock_connection):
+    """Create a mock database pool whose acquire() yields mock_connection."""
+    mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+    return mock_db_pool
+
+
 @pytest.fixture
 def user_service(temp_config_file, monkeypatch):
     """Create a UserService instance with mocked environment variables."""
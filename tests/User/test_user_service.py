@@ -4,12 +4,11 @@ Tests all methods, edge cases, and error scenarios.
 """
 import pytest
 import asyncpg
-from unittest.mock import AsyncMock, MagicMock, patch, Mock
+from unittest.mock import AsyncMock, patch, Mock
 from datetime import datetime
 import asyncio
 from User.user_service import UserService
 import os
-from tests.User.conftest import create_async_context_manager
 
 
 class TestUserServiceInitialization:
@@ -57,30 +56,24 @@ class TestUserServiceInitialization:
 class TestUserServiceInitialize:
     """Tests for the initialize() method."""
     
-    @pytest.mark.asyncio
-    async def test_initialize_creates_pool_and_tables(self, user_service, mock_db_pool, mock_connection):
+    async def test_initialize_creates_pool_and_tables(self, user_service, wired_pool, mock_connection):
         """Test that initialize() creates pool and initializes tables."""
         with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
-            mock_create_pool.return_value = mock_db_pool
-            
-            # Mock connection context manager - acquire() is a regular method that returns an async context manager
-            mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+            mock_create_pool.return_value = wired_pool
             mock_connection.execute = AsyncMock()
             
             await user_service.initialize()
             
-            assert user_service.pool == mock_db_pool
+            assert user_service.pool == wired_pool
             assert user_service._initialized is True
             assert mock_create_pool.called
             # Verify table creation was called
             assert mock_connection.execute.call_count >= 4  # At least 4 CREATE statements
     
-    @pytest.mark.asyncio
-    async def test_initialize_idempotent(self, user_service, mock_db_pool, mock_connection):
+    async def test_initialize_idempotent(self, user_service, wired_pool, mock_connection):
         """Test that initialize() is idempotent."""
         with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
-            mock_create_pool.return_value = mock_db_pool
-            mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+            mock_create_pool.return_value = wired_pool
             mock_connection.execute = AsyncMock()
             
             await user_service.initialize()
@@ -90,7 +83,6 @@ class TestUserServiceInitialize:
             # Should not create pool again
             assert mock_create_pool.call_count == first_call_count
     
-    @pytest.mark.asyncio
     async def test_initialize_handles_errors(self, user_service):
         """Test that initialize() properly handles errors."""
         with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
@@ -105,11 +97,9 @@ class TestUserServiceInitialize:
 class TestUserServiceRegisterUser:
     """Tests for the register_user() method."""
     
-    @pytest.mark.asyncio
-    async def test_register_user_success(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_register_user_success(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test successful user registration."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         mock_connection.execute = AsyncMock()
         
         user_id = await user_service.register_user(
@@ -123,7 +113,6 @@ class TestUserServiceRegisterUser:
         assert len(user_id) > 0
         assert mock_connection.execute.called
     
-    @pytest.mark.asyncio
     async def test_register_user_without_pool_raises_error(self, user_service, sample_user_data):
         """Test that register_user() raises error when pool is not initialized."""
         user_service.pool = None
@@ -135,11 +124,9 @@ class TestUserServiceRegisterUser:
                 sample_user_data['password']
             )
     
-    @pytest.mark.asyncio
-    async def test_register_user_duplicate_email(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_register_user_duplicate_email(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test that registering duplicate email returns None."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         # Simulate UniqueViolationError
         error = asyncpg.UniqueViolationError("duplicate key value")
@@ -153,11 +140,9 @@ class TestUserServiceRegisterUser:
         
         assert result is None
     
-    @pytest.mark.asyncio
-    async def test_register_user_duplicate_username(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_register_user_duplicate_username(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test that registering duplicate username returns None."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         error = asyncpg.UniqueViolationError("duplicate key value")
         mock_connection.execute = AsyncMock(side_effect=error)
@@ -170,11 +155,9 @@ class TestUserServiceRegisterUser:
         
         assert result is None
     
-    @pytest.mark.asyncio
-    async def test_register_user_other_exception_raises(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_register_user_other_exception_raises(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test that other exceptions during registration are raised."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.execute = AsyncMock(side_effect=Exception("Database error"))
         
@@ -185,11 +168,9 @@ class TestUserServiceRegisterUser:
                 sample_user_data['password']
             )
     
-    @pytest.mark.asyncio
-    async def test_register_user_generates_unique_user_id(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_register_user_generates_unique_user_id(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test that each registration generates a unique user_id."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         mock_connection.execute = AsyncMock()
         
         user_id1 = await user_service.register_user(
@@ -206,11 +187,9 @@ class TestUserServiceRegisterUser:
         
         assert user_id1 != user_id2
     
-    @pytest.mark.asyncio
-    async def test_register_user_hashes_password(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_register_user_hashes_password(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test that password is hashed before storage."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         captured_args = []
         def capture_execute(*args, **kwargs):
@@ -242,11 +221,9 @@ class TestUserServiceRegisterUser:
 class TestUserServiceLogin:
     """Tests for the login() method."""
     
-    @pytest.mark.asyncio
-    async def test_login_success_with_username(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_login_success_with_username(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test successful login with username."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         # Mock user record - create a proper mock that supports dictionary-like access
         salt = 'salt123'
@@ -268,11 +245,9 @@ class TestUserServiceLogin:
         assert user_id == sample_user_data['user_id']
         assert mock_connection.execute.called  # last_login update
     
-    @pytest.mark.asyncio
-    async def test_login_success_with_email(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_login_success_with_email(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test successful login with email."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         salt = 'salt123'
         password_hash = user_service._hash_password(sample_user_data['password'], salt)
@@ -293,11 +268,9 @@ class TestUserServiceLogin:
         
         assert user_id == sample_user_data['user_id']
     
-    @pytest.mark.asyncio
-    async def test_login_user_not_found(self, user_service, mock_db_pool, mock_connection):
+    async def test_login_user_not_found(self, user_service, wired_pool, mock_connection):
         """Test login when user doesn't exist."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.fetchrow = AsyncMock(return_value=None)
         
@@ -305,11 +278,9 @@ class TestUserServiceLogin:
         
         assert result is None
     
-    @pytest.mark.asyncio
-    async def test_login_incorrect_password(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_login_incorrect_password(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test login with incorrect password."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         salt = 'salt123'
         correct_hash = user_service._hash_password('correct_password', salt)
@@ -329,7 +300,6 @@ class TestUserServiceLogin:
         
         assert result is None
     
-    @pytest.mark.asyncio
     async def test_login_without_pool_raises_error(self, user_service, sample_user_data):
         """Test that login() raises error when pool is not initialized."""
         user_service.pool = None
@@ -340,11 +310,9 @@ class TestUserServiceLogin:
                 sample_user_data['password']
             )
     
-    @pytest.mark.asyncio
-    async def test_login_updates_last_login(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_login_updates_last_login(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test that login updates last_login timestamp."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         salt = 'salt123'
         password_hash = user_service._hash_password(sample_user_data['password'], salt)
@@ -372,11 +340,9 @@ class TestUserServiceLogin:
 class TestUserServiceAddSession:
     """Tests for the add_session() method."""
     
-    @pytest.mark.asyncio
-    async def test_add_session_success(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_add_session_success(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test successful session addition."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         mock_connection.fetchval = AsyncMock(return_value=True)  # User exists
         mock_connection.execute = AsyncMock()
         
@@ -388,7 +354,6 @@ class TestUserServiceAddSession:
         assert session_id == sample_session_data['session_id']
         assert mock_connection.execute.called
     
-    @pytest.mark.asyncio
     async def test_add_session_without_pool_raises_error(self, user_service, sample_session_data):
         """Test that add_session() raises error when pool is not initialized."""
         user_service.pool = None
@@ -399,11 +364,9 @@ class TestUserServiceAddSession:
                 sample_session_data['user_id']
             )
     
-    @pytest.mark.asyncio
-    async def test_add_session_handles_exceptions(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_add_session_handles_exceptions(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test that add_session() properly handles exceptions."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         mock_connection.fetchval = AsyncMock(return_value=True)  # User exists
         
         mock_connection.execute = AsyncMock(side_effect=Exception("Database error"))
@@ -418,11 +381,9 @@ class TestUserServiceAddSession:
 class TestUserServiceGetSessions:
     """Tests for the get_sessions() method."""
     
-    @pytest.mark.asyncio
-    async def test_get_sessions_success(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_get_sessions_success(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test successful retrieval of sessions."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         # Mock session records
         mock_session1 = {
@@ -445,11 +406,9 @@ class TestUserServiceGetSessions:
         assert len(sessions) == 2
         assert isinstance(sessions, list)
     
-    @pytest.mark.asyncio
-    async def test_get_sessions_empty_list(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_get_sessions_empty_list(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test get_sessions() returns empty list when user has no sessions."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.fetch = AsyncMock(return_value=[])
         
@@ -457,7 +416,6 @@ class TestUserServiceGetSessions:
         
         assert sessions == []
     
-    @pytest.mark.asyncio
     async def test_get_sessions_without_pool_raises_error(self, user_service, sample_session_data):
         """Test that get_sessions() raises error when pool is not initialized."""
         user_service.pool = None
@@ -465,11 +423,9 @@ class TestUserServiceGetSessions:
         with pytest.raises(RuntimeError, match="Unable to connect to the database"):
             await user_service.get_sessions(sample_session_data['user_id'])
     
-    @pytest.mark.asyncio
-    async def test_get_sessions_handles_exceptions(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_get_sessions_handles_exceptions(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test that get_sessions() properly handles exceptions."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.fetch = AsyncMock(side_effect=Exception("Database error"))
         
@@ -480,11 +436,9 @@ class TestUserServiceGetSessions:
 class TestUserServiceGetSessionTitle:
     """Tests for the get_session_title() method."""
     
-    @pytest.mark.asyncio
-    async def test_get_session_title_success(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_get_session_title_success(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test successful session title retrieval."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.fetchval = AsyncMock(return_value="My Session Title")
         
@@ -496,11 +450,9 @@ class TestUserServiceGetSessionTitle:
         assert title == "My Session Title"
         assert mock_connection.fetchval.called
     
-    @pytest.mark.asyncio
-    async def test_get_session_title_none(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_get_session_title_none(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test get_session_title() when title is not set."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.fetchval = AsyncMock(return_value=None)
         
@@ -511,7 +463,6 @@ class TestUserServiceGetSessionTitle:
         
         assert title is None
     
-    @pytest.mark.asyncio
     async def test_get_session_title_without_pool_raises_error(self, user_service, sample_session_data):
         """Test that get_session_title() raises error when pool is not initialized."""
         user_service.pool = None
@@ -522,11 +473,9 @@ class TestUserServiceGetSessionTitle:
                 sample_session_data['session_id']
             )
     
-    @pytest.mark.asyncio
-    async def test_get_session_title_handles_exceptions(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_get_session_title_handles_exceptions(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test that get_session_title() properly handles exceptions."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.fetchval = AsyncMock(side_effect=Exception("Database error"))
         
@@ -540,11 +489,9 @@ class TestUserServiceGetSessionTitle:
 class TestUserServiceUpdateTitle:
     """Tests for the update_title() method."""
     
-    @pytest.mark.asyncio
-    async def test_update_title_success(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_update_title_success(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test successful session title update."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.execute = AsyncMock(return_value="UPDATE 1")
         
@@ -557,11 +504,9 @@ class TestUserServiceUpdateTitle:
         assert result is True
         assert mock_connection.execute.called
     
-    @pytest.mark.asyncio
-    async def test_update_title_not_found(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_update_title_not_found(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test update_title() when session doesn't exist."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.execute = AsyncMock(return_value="UPDATE 0")
         
@@ -573,7 +518,6 @@ class TestUserServiceUpdateTitle:
         
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_update_title_without_pool_raises_error(self, user_service, sample_session_data):
         """Test that update_title() raises error when pool is not initialized."""
         user_service.pool = None
@@ -585,11 +529,9 @@ class TestUserServiceUpdateTitle:
                 "New Title"
             )
     
-    @pytest.mark.asyncio
-    async def test_update_title_handles_exceptions(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_update_title_handles_exceptions(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test that update_title() properly handles exceptions."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.execute = AsyncMock(side_effect=Exception("Database error"))
         
@@ -604,11 +546,9 @@ class TestUserServiceUpdateTitle:
 class TestUserServiceDeleteSession:
     """Tests for the delete_session() method."""
     
-    @pytest.mark.asyncio
-    async def test_delete_session_success(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_delete_session_success(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test successful session deletion."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.execute = AsyncMock(return_value="DELETE 1")
         
@@ -620,11 +560,9 @@ class TestUserServiceDeleteSession:
         assert result is True
         assert mock_connection.execute.called
     
-    @pytest.mark.asyncio
-    async def test_delete_session_not_found(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_delete_session_not_found(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test delete_session() when session doesn't exist."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.execute = AsyncMock(return_value="DELETE 0")
         
@@ -635,7 +573,6 @@ class TestUserServiceDeleteSession:
         
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_delete_session_without_pool_raises_error(self, user_service, sample_session_data):
         """Test that delete_session() raises error when pool is not initialized."""
         user_service.pool = None
@@ -646,11 +583,9 @@ class TestUserServiceDeleteSession:
                 sample_session_data['session_id']
             )
     
-    @pytest.mark.asyncio
-    async def test_delete_session_handles_exceptions(self, user_service, mock_db_pool, mock_connection, sample_session_data):
+    async def test_delete_session_handles_exceptions(self, user_service, wired_pool, mock_connection, sample_session_data):
         """Test that delete_session() properly handles exceptions."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.execute = AsyncMock(side_effect=Exception("Database error"))
         
@@ -664,11 +599,9 @@ class TestUserServiceDeleteSession:
 class TestUserServiceDeleteUser:
     """Tests for the delete_user() method."""
     
-    @pytest.mark.asyncio
-    async def test_delete_user_success(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_delete_user_success(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test successful user deletion."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.execute = AsyncMock(return_value="DELETE 1")
         
@@ -677,11 +610,9 @@ class TestUserServiceDeleteUser:
         assert result is True
         assert mock_connection.execute.called
     
-    @pytest.mark.asyncio
-    async def test_delete_user_not_found(self, user_service, mock_db_pool, mock_connection):
+    async def test_delete_user_not_found(self, user_service, wired_pool, mock_connection):
         """Test delete_user() when user doesn't exist."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.execute = AsyncMock(return_value="DELETE 0")
         
@@ -689,7 +620,6 @@ class TestUserServiceDeleteUser:
         
         assert result is False
     
-    @pytest.mark.asyncio
     async def test_delete_user_without_pool_raises_error(self, user_service, sample_user_data):
         """Test that delete_user() raises error when pool is not initialized."""
         user_service.pool = None
@@ -697,11 +627,9 @@ class TestUserServiceDeleteUser:
         with pytest.raises(RuntimeError, match="Unable to connect to the database"):
             await user_service.delete_user(sample_user_data['user_id'])
     
-    @pytest.mark.asyncio
-    async def test_delete_user_handles_exceptions(self, user_service, mock_db_pool, mock_connection, sample_user_data):
+    async def test_delete_user_handles_exceptions(self, user_service, wired_pool, mock_connection, sample_user_data):
         """Test that delete_user() properly handles exceptions."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         
         mock_connection.execute = AsyncMock(side_effect=Exception("Database error"))
         
@@ -712,11 +640,9 @@ class TestUserServiceDeleteUser:
 class TestUserServiceHealthCheck:
     """Tests for the health_check() method."""
     
-    @pytest.mark.asyncio
-    async def test_health_check_success(self, user_service, mock_db_pool, mock_connection):
+    async def test_health_check_success(self, user_service, wired_pool, mock_connection):
         """Test successful health check."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         mock_connection.execute = AsyncMock()
         
         result = await user_service.health_check()
@@ -724,7 +650,6 @@ class TestUserServiceHealthCheck:
         assert result is True
         assert mock_connection.execute.called
     
-    @pytest.mark.asyncio
     async def test_health_check_no_pool(self, user_service):
         """Test health check when pool is not initialized."""
         user_service.pool = None
@@ -733,11 +658,9 @@ class TestUserServiceHealthCheck:
         
         assert result is False
     
-    @pytest.mark.asyncio
-    async def test_health_check_database_error(self, user_service, mock_db_pool, mock_connection):
+    async def test_health_check_database_error(self, user_service, wired_pool, mock_connection):
         """Test health check when database query fails."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         mock_connection.execute = AsyncMock(side_effect=Exception("Connection error"))
         
         result = await user_service.health_check()
@@ -795,22 +718,19 @@ class TestUserServicePasswordHashing:
 class TestUserServiceContextManager:
     """Tests for async context manager functionality."""
     
-    @pytest.mark.asyncio
-    async def test_context_manager_initializes_and_closes(self, user_service, mock_db_pool, mock_connection):
+    async def test_context_manager_initializes_and_closes(self, user_service, wired_pool, mock_connection):
         """Test that context manager properly initializes and closes."""
         with patch('asyncpg.create_pool', new_callable=AsyncMock) as mock_create_pool:
-            mock_create_pool.return_value = mock_db_pool
-            mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
-            mock_db_pool.close = AsyncMock()
+            mock_create_pool.return_value = wired_pool
+            wired_pool.close = AsyncMock()
             mock_connection.execute = AsyncMock()
             
             async with user_service as service:
                 assert service._initialized is True
             
             # Verify close was called
-            assert mock_db_pool.close.called
+            assert wired_pool.close.called
     
-    @pytest.mark.asyncio
     async def test_close_method(self, user_service, mock_db_pool):
         """Test the close() method."""
         user_service.pool = mock_db_pool
@@ -822,7 +742,6 @@ class TestUserServiceContextManager:
         assert mock_db_pool.close.called
         assert user_service._initialized is False
     
-    @pytest.mark.asyncio
     async def test_close_without_pool(self, user_service):
         """Test close() when pool is None."""
         user_service.pool = None
@@ -837,7 +756,6 @@ class TestUserServiceContextManager:
 class TestUserServiceEdgeCases:
     """Tests for edge cases and boundary conditions."""
     
-    @pytest.mark.asyncio
     async def test_register_user_empty_strings(self, user_service, mock_db_pool, mock_connection):
         """Test register_user() with empty strings."""
         user_service.pool = mock_db_pool
@@ -846,22 +764,18 @@ class TestUserServiceEdgeCases:
         
         assert user_id is None  # Empty strings are now rejected
     
-    @pytest.mark.asyncio
-    async def test_login_empty_credentials(self, user_service, mock_db_pool, mock_connection):
+    async def test_login_empty_credentials(self, user_service, wired_pool, mock_connection):
         """Test login() with empty credentials."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         mock_connection.fetchrow = AsyncMock(return_value=None)
         
         result = await user_service.login("", "")
         
         assert result is None
     
-    @pytest.mark.asyncio
-    async def test_get_sessions_nonexistent_user(self, user_service, mock_db_pool, mock_connection):
+    async def test_get_sessions_nonexistent_user(self, user_service, wired_pool, mock_connection):
         """Test get_sessions() for non-existent user."""
-        user_service.pool = mock_db_pool
-        mock_db_pool.acquire = MagicMock(return_value=create_async_context_manager(mock_connection))
+        user_service.pool = wired_pool
         mock_connection.fetch = AsyncMock(return_value=[])
         
         sessions = await user_service.get_sessions("nonexistent_user_id")
@@ -3,22 +3,48 @@ Pytest configuration and fixtures for VectorStore tests.
 """
 import pytest
 import os
-import tempfile
 import yaml
 from pathlib import Path
-from unittest.mock import MagicMock, patch, Mock
+from unittest.mock import MagicMock, patch, Mock, DEFAULT
 from typing import Dict, Any
 import io
 import zipfile
+from collections import namedtuple
+from contextlib import ExitStack
 
+from fastapi.testclient import TestClient
+
+from VectorStore.vectorstore_api import app
 from VectorStore.vectorstore_service import PineconeService
 from VectorStore.document_loader import DocumentLoaderFactory
 from langchain_core.documents import Document
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 
-@pytest.fixture
-def temp_config_file():
-    """Create a temporary config.yaml file for testing."""
+
+def _load_yaml(f):
+    """Parse YAML with the libyaml-backed loader when it is available."""
+    return yaml.load(f, Loader=_Loader)
+
+
+@pytest.fixture(scope="session")
+def _test_client():
+    """
+    Create one TestClient for the whole session.
+    
+    The client is deliberately not entered as a context manager so the app
+    lifespan (which builds a real PineconeService) never runs; tests only
+    swap `app.dependency_overrides` and the patched globals around it.
+    """
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory):
+    """Write a config.yaml file once for the test session."""
     config_data = {
         'pinecone': {
             'cloud': 'aws',
@@ -40,15 +66,23 @@ def temp_config_file():
         }
     }
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+    config_path = tmp_path_factory.mktemp("config") / "config.yaml"
+    with open(config_path, 'w') as f:
         yaml.dump(config_data, f)
-        temp_path = f.name
     
-    yield temp_path
+    # pytest removes the base temp directory itself, so no cleanup is needed
+    return str(config_path)
+
+
+@pytest.fixture(scope="session")
+def config_data(temp_config_file):
+    """
+    Parsed contents of temp_config_file, loaded once per session.
     
-    # Cleanup
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
+    Shared across tests: deep-copy it before mutating.
+    """
+    with open(temp_config_file, 'r') as f:
+        return _load_yaml(f)
 
 
 @pytest.fixture
@@ -113,41 +147,148 @@ def mock_requests_get():
         yield mock_get
 
 
+_SERVICE_ENV = {
+    'PINECONE_API_KEY': 'test_api_key',
+    'PINECONE_INDEX_NAME': 'test_index',
+    'GEMINI_API_KEY': 'test_gemini_key',
+    'S3_BUCKET_NAME': 'test_bucket',
+    'AWS_ACCESS_KEY_ID': 'test_access_key',
+    'AWS_SECRET_ACCESS_KEY': 'test_secret_key',
+    'AWS_REGION': 'us-east-1'
+}
+
+
 @pytest.fixture
-def vectorstore_service(temp_config_file, mock_pinecone_client, mock_embedding_model, mock_vector_store, mock_s3_client):
-    """Create a PineconeService instance with mocked dependencies."""
-    with patch.dict(os.environ, {
-        'PINECONE_API_KEY': 'test_api_key',
-        'PINECONE_INDEX_NAME': 'test_index',
-        'GEMINI_API_KEY': 'test_gemini_key',
-        'S3_BUCKET_NAME': 'test_bucket',
-        'AWS_ACCESS_KEY_ID': 'test_access_key',
-        'AWS_SECRET_ACCESS_KEY': 'test_secret_key',
-        'AWS_REGION': 'us-east-1'
-    }), \
-    patch('VectorStore.vectorstore_service.load_config') as mock_load_config, \
-    patch('VectorStore.vectorstore_service.PineconeClient') as mock_pinecone_class, \
-    patch('VectorStore.vectorstore_service.GoogleGenerativeAIEmbeddings') as mock_embeddings_class, \
-    patch('VectorStore.vectorstore_service.PineconeVectorStore') as mock_vector_store_class, \
+def full_env(monkeypatch):
+    """
+    Set the environment PineconeService expects.
+    
+    Returns the monkeypatch so tests can drop or add keys, e.g.
+    `full_env.delenv('PINECONE_INDEX_NAME')`.
+    """
+    for key, value in _SERVICE_ENV.items():
+        monkeypatch.setenv(key, value)
+    return monkeypatch
+
+
+@pytest.fixture(scope="session")
+def _service_patches():
+    """Patch PineconeService's external dependencies once for the session."""
+    with patch.dict(os.environ, _SERVICE_ENV), \
+    patch.multiple(
+        'VectorStore.vectorstore_service',
+        load_config=DEFAULT,
+        PineconeClient=DEFAULT,
+        GoogleGenerativeAIEmbeddings=DEFAULT,
+        PineconeVectorStore=DEFAULT
+    ) as mocks, \
     patch('VectorStore.vectorstore_service.boto3.client') as mock_boto3_client:
+        mocks['boto3_client'] = mock_boto3_client
+        yield mocks
+
+
+ServiceDeps = namedtuple(
+    'ServiceDeps',
+    ['load_config', 'pinecone_client', 'gemini_embeddings', 'openai_embeddings', 'vector_store', 'boto3']
+)
+
+
+@pytest.fixture
+def patched_service_deps(mock_pinecone_client, mock_embedding_model, mock_vector_store, mock_s3_client, config_data):
+    """
+    Patch every external dependency of PineconeService for a single test.
+    
+    Yields the class-level mocks so tests only override what they care about,
+    e.g. `patched_service_deps.boto3.side_effect = Exception(...)`.
+    """
+    module = 'VectorStore.vectorstore_service'
+    with ExitStack() as stack:
+        deps = ServiceDeps(
+            load_config=stack.enter_context(patch(f'{module}.load_config')),
+            pinecone_client=stack.enter_context(patch(f'{module}.PineconeClient')),
+            gemini_embeddings=stack.enter_context(patch(f'{module}.GoogleGenerativeAIEmbeddings')),
+            openai_embeddings=stack.enter_context(patch(f'{module}.OpenAIEmbeddings')),
+            vector_store=stack.enter_context(patch(f'{module}.PineconeVectorStore')),
+            boto3=stack.enter_context(patch(f'{module}.boto3.client'))
+        )
         
-        # Load actual config from temp file
-        with open(temp_config_file, 'r') as f:
-            config_data = yaml.safe_load(f)
-        
-        mock_load_config.return_value = config_data
-        mock_pinecone_class.return_value = mock_pinecone_client
-        mock_embeddings_class.return_value = mock_embedding_model
-        mock_vector_store_class.return_value = mock_vector_store
-        mock_boto3_client.return_value = mock_s3_client
-        
-        service = PineconeService()
-        service.client = mock_pinecone_client
-        service.embedding_model = mock_embedding_model
-        service.vector_store = mock_vector_store
-        service.s3_client = mock_s3_client
+        deps.load_config.return_value = config_data
+        deps.pinecone_client.return_value = mock_pinecone_client
+        deps.gemini_embeddings.return_value = mock_embedding_model
+        deps.openai_embeddings.return_value = mock_embedding_model
+        deps.vector_store.return_value = mock_vector_store
+        deps.boto3.return_value = mock_s3_client
         
-        yield service
+        yield deps
+
+
+@pytest.fixture(scope="module")
+def _loader_factory_patch():
+    """
+    Patch DocumentLoaderFactory once per test module.
+    
+    The mock wraps the real factory, so tests that never configure it (and
+    run after it was installed) still get real extension lookups.
+    """
+    with patch('VectorStore.vectorstore_service.DocumentLoaderFactory', wraps=DocumentLoaderFactory) as mock_factory:
+        yield mock_factory
+
+
+@pytest.fixture
+def patched_loader_factory(_loader_factory_patch):
+    """Module-wide DocumentLoaderFactory mock, reset to pass-through after each test."""
+    yield _loader_factory_patch
+    _loader_factory_patch.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def _module_vectorstore_service(_service_patches, config_data):
+    """
+    Build one PineconeService per test module.
+    
+    Yields the service together with a snapshot of its instance attributes
+    taken right after __init__, so each test can start from that state.
+    """
+    _service_patches['load_config'].return_value = config_data
+    
+    service = PineconeService()
+    yield service, dict(vars(service))
+
+
+@pytest.fixture
+def vectorstore_service(_module_vectorstore_service, mock_pinecone_client, mock_embedding_model, mock_vector_store, mock_s3_client):
+    """
+    Module-wide PineconeService with fresh mocked dependencies for each test.
+    
+    Instance attributes are restored from the post-__init__ snapshot, which
+    also undoes tests that overwrite them (e.g. `s3_client = None`).
+    """
+    service, initial_state = _module_vectorstore_service
+    vars(service).update(initial_state)
+    service.client = mock_pinecone_client
+    service.embedding_model = mock_embedding_model
+    service.vector_store = mock_vector_store
+    service.s3_client = mock_s3_client
+    
+    yield service
+
+
+@pytest.fixture
+def search_results():
+    """Queue of results returned by successive mocked search calls."""
+    return []
+
+
+@pytest.fixture
+def ingest_results():
+    """Queue of stats returned by successive mocked ingest_* calls."""
+    return []
+
+
+@pytest.fixture
+def upload_url_results():
+    """Queue of results returned by successive mocked generate_s3_upload_url calls."""
+    return []
 
 
 @pytest.fixture
@@ -165,6 +306,15 @@ def sample_documents():
     ]
 
 
+@pytest.fixture(scope="session")
+def sample_search_docs():
+    """Search result documents shared by the search tests; copy before mutating."""
+    return (
+        Document(page_content="Test content 1", metadata={"source": "test1.pdf"}),
+        Document(page_content="Test content 2", metadata={"source": "test2.pdf"})
+    )
+
+
 @pytest.fixture
 def sample_text_file():
     """Create a sample text file for testing."""
@@ -172,15 +322,23 @@ def sample_text_file():
     return content
 
 
-@pytest.fixture
-def sample_zip_file():
-    """Create a sample zip file for testing."""
+def _build_zip() -> bytes:
+    """Build the bytes of a small zip archive with two text files."""
     zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zip_file:
         zip_file.writestr("test1.txt", "Content of test1.txt")
         zip_file.writestr("test2.txt", "Content of test2.txt")
-    zip_buffer.seek(0)
-    return zip_buffer.read()
+    return zip_buffer.getvalue()
+
+
+# Built once at import; bytes are immutable so every test can share them.
+_SAMPLE_ZIP_BYTES = _build_zip()
+
+
+@pytest.fixture(scope="session")
+def sample_zip_file():
+    """Sample zip file content for testing."""
+    return _SAMPLE_ZIP_BYTES
 
 
 @pytest.fixture
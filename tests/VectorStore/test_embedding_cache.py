@@ -0,0 +1,80 @@
+"""
+Tests for the persistent CachedEmbeddings wrapper.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from VectorStore.embedding_cache import CachedEmbeddings
+
+
+@pytest.fixture
+def base_embeddings():
+    """Embedding model returning a distinct float32-exact vector per text."""
+    model = MagicMock()
+    model.embedding_dimension = 2
+    model.embed_documents = MagicMock(side_effect=lambda texts: [[float(len(t)), 0.5] for t in texts])
+    model.embed_query = MagicMock(side_effect=lambda text: [float(len(text)), 0.25])
+    return model
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Location of the SQLite cache file."""
+    return str(tmp_path / "cache" / "embeddings.sqlite")
+
+
+class TestCachedEmbeddings:
+    """Tests for CachedEmbeddings."""
+
+    def test_embed_documents_only_embeds_misses(self, base_embeddings, cache_path):
+        """Test cached documents are not sent to the wrapped model again."""
+        cached = CachedEmbeddings(base_embeddings, model_name="model-a", path=cache_path)
+
+        first = cached.embed_documents(["a", "bb"])
+        second = cached.embed_documents(["bb", "ccc", "ccc"])
+
+        assert first == [[1.0, 0.5], [2.0, 0.5]]
+        assert second == [[2.0, 0.5], [3.0, 0.5], [3.0, 0.5]]
+        assert base_embeddings.embed_documents.call_args_list[1][0][0] == ["ccc"]
+
+    def test_embed_query_persists_across_instances(self, base_embeddings, cache_path):
+        """Test query vectors survive a new wrapper over the same file."""
+        CachedEmbeddings(base_embeddings, model_name="model-a", path=cache_path).embed_query("hello")
+
+        vector = CachedEmbeddings(base_embeddings, model_name="model-a", path=cache_path).embed_query("hello")
+
+        assert vector == [5.0, 0.25]
+        base_embeddings.embed_query.assert_called_once()
+
+    def test_keys_are_scoped_by_model_and_kind(self, base_embeddings, cache_path):
+        """Test the same text is cached separately per model and per query/document."""
+        CachedEmbeddings(base_embeddings, model_name="model-a", path=cache_path).embed_query("hello")
+
+        CachedEmbeddings(base_embeddings, model_name="model-b", path=cache_path).embed_query("hello")
+        CachedEmbeddings(base_embeddings, model_name="model-a", path=cache_path).embed_documents(["hello"])
+
+        assert base_embeddings.embed_query.call_count == 2
+        base_embeddings.embed_documents.assert_called_once()
+
+    def test_forwards_model_attributes(self, base_embeddings, cache_path):
+        """Test attributes like embedding_dimension come from the wrapped model."""
+        cached = CachedEmbeddings(base_embeddings, model_name="model-a", path=cache_path)
+
+        assert cached.embedding_dimension == 2
+
+    def test_uses_wal_journal(self, base_embeddings, cache_path):
+        """Test the cache file is opened in WAL mode so reads are not blocked by writes."""
+        cached = CachedEmbeddings(base_embeddings, model_name="model-a", path=cache_path)
+
+        assert cached._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_drops_oldest_beyond_max_entries(self, base_embeddings, cache_path):
+        """Test the table is trimmed to max_entries, evicting the oldest vectors first."""
+        cached = CachedEmbeddings(base_embeddings, model_name="model-a", path=cache_path, max_entries=2)
+        cached.embed_documents(["a", "bb"])
+        cached.embed_documents(["ccc"])
+
+        assert cached._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0] == 2
+
+        cached.embed_documents(["bb", "ccc", "a"])
+        assert base_embeddings.embed_documents.call_args_list[-1][0][0] == ["a"]
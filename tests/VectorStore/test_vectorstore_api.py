@@ -4,21 +4,65 @@ Tests all endpoints, authentication, and error scenarios.
 """
 import pytest
 from unittest.mock import MagicMock, patch, Mock
-from fastapi.testclient import TestClient
 from fastapi import HTTPException
+import asyncio
+import httpx
 import io
 
 from VectorStore.vectorstore_api import app
 from VectorStore.vectorstore_service import PineconeService
-from tests.VectorStore.conftest import *
+
+
+class _FakePineconeService:
+    """
+    Lightweight stand-in for PineconeService.
+    
+    Only exposes the attributes the API touches, each as a plain MagicMock,
+    which avoids the class introspection done by MagicMock(spec=...).
+    """
+    _ATTRIBUTES = (
+        'client',
+        'get_index_stats',
+        'generate_s3_upload_url',
+        'ingest_from_s3_key',
+        'ingest_from_file_content',
+        'ingest_documents',
+        'search',
+        'search_batch',
+        'delete_namespace',
+    )
+    
+    def __init__(self):
+        self.pinecone_index_name = "test_index"
+        for name in self._ATTRIBUTES:
+            setattr(self, name, MagicMock())
+    
+    def __getattr__(self, name):
+        # Only reached for attributes that were never set, mirroring spec=PineconeService
+        if hasattr(PineconeService, name):
+            raise AttributeError(f"_FakePineconeService does not stub PineconeService.{name}")
+        raise AttributeError(f"PineconeService has no attribute '{name}'")
+
+
+def _pop_next(queue):
+    """Build a side_effect that hands out queued results in order, raising queued exceptions."""
+    def _next(*args, **kwargs):
+        result = queue.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return _next
 
 
 @pytest.fixture
-def mock_pinecone_service():
-    """Create a mock PineconeService."""
-    service = MagicMock(spec=PineconeService)
-    service.pinecone_index_name = "test_index"
-    service.client = MagicMock()
+def mock_pinecone_service(search_results, ingest_results, upload_url_results):
+    """Create a mock PineconeService fed from the per-test result queues."""
+    service = _FakePineconeService()
+    service.search.side_effect = _pop_next(search_results)
+    service.ingest_from_s3_key.side_effect = _pop_next(ingest_results)
+    service.ingest_from_file_content.side_effect = _pop_next(ingest_results)
+    service.ingest_documents.side_effect = _pop_next(ingest_results)
+    service.generate_s3_upload_url.side_effect = _pop_next(upload_url_results)
     return service
 
 
@@ -29,8 +73,8 @@ def mock_current_user():
 
 
 @pytest.fixture
-def client(mock_pinecone_service):
-    """Create a test client with mocked service."""
+def client(_test_client, mock_pinecone_service):
+    """Set up auth overrides and patches around the shared test client."""
     from VectorStore.jwt_utils import get_current_user, verify_token
     
     # Mock verify_token to return a valid payload for test tokens
@@ -52,7 +96,7 @@ def client(mock_pinecone_service):
     # Patch verify_token in the middleware and the global service
     with patch('VectorStore.vectorstore_api.pinecone_service', mock_pinecone_service), \
          patch('VectorStore.vectorstore_api.verify_token', mock_verify_token):
-        yield TestClient(app)
+        yield _test_client
     
     # Cleanup
     app.dependency_overrides.clear()
@@ -89,7 +133,7 @@ class TestVectorStoreAPIIndexManagement:
         
         assert response.status_code == 503
     
-    def test_get_index_stats_unauthorized(self, mock_pinecone_service):
+    def test_get_index_stats_unauthorized(self, _test_client, mock_pinecone_service):
         """Test get index stats without authentication."""
         from VectorStore.jwt_utils import get_current_user
         
@@ -99,8 +143,7 @@ class TestVectorStoreAPIIndexManagement:
         app.dependency_overrides[get_current_user] = override_get_current_user
         
         with patch('VectorStore.vectorstore_api.pinecone_service', mock_pinecone_service):
-            client = TestClient(app)
-            response = client.get("/vectorstore/index/stats")
+            response = _test_client.get("/vectorstore/index/stats")
         
         app.dependency_overrides.clear()
         assert response.status_code == 401
@@ -109,9 +152,9 @@ class TestVectorStoreAPIIndexManagement:
 class TestVectorStoreAPIUploadS3:
     """Tests for S3 upload endpoints."""
     
-    def test_generate_presigned_url_success(self, client, mock_pinecone_service):
+    def test_generate_presigned_url_success(self, client, mock_pinecone_service, upload_url_results):
         """Test successful presigned URL generation."""
-        mock_pinecone_service.generate_s3_upload_url = MagicMock(return_value={
+        upload_url_results.append({
             'presigned_url': 'https://s3.amazonaws.com/bucket/key?presigned=...',
             's3_key': 'uploads/user123/20240101/uuid.pdf',
             'expires_in': 3600,
@@ -132,9 +175,9 @@ class TestVectorStoreAPIUploadS3:
         assert response.json()["success"] is True
         assert "presigned_url" in response.json()
     
-    def test_generate_presigned_url_s3_not_configured(self, client, mock_pinecone_service):
+    def test_generate_presigned_url_s3_not_configured(self, client, mock_pinecone_service, upload_url_results):
         """Test presigned URL generation when S3 is not configured."""
-        mock_pinecone_service.generate_s3_upload_url = MagicMock(side_effect=ValueError("S3 is not configured"))
+        upload_url_results.append(ValueError("S3 is not configured"))
         
         response = client.post(
             "/vectorstore/presigned-url",
@@ -145,9 +188,9 @@ class TestVectorStoreAPIUploadS3:
         assert response.status_code == 400
 
     
-    def test_process_s3_upload_success(self, client, mock_pinecone_service):
+    def test_process_s3_upload_success(self, client, mock_pinecone_service, ingest_results):
         """Test successful S3 upload processing."""
-        mock_pinecone_service.ingest_from_s3_key = MagicMock(return_value={
+        ingest_results.append({
             'total_files': 1,
             'total_documents': 1,
             'total_chunks': 5,
@@ -172,9 +215,9 @@ class TestVectorStoreAPIUploadS3:
 class TestVectorStoreAPIUploadLocal:
     """Tests for local upload endpoints."""
     
-    def test_upload_file_success(self, client, mock_pinecone_service):
+    def test_upload_file_success(self, client, mock_pinecone_service, ingest_results):
         """Test successful file upload."""
-        mock_pinecone_service.ingest_from_file_content = MagicMock(return_value={
+        ingest_results.append({
             'total_files': 1,
             'total_documents': 1,
             'total_chunks': 3,
@@ -194,9 +237,10 @@ class TestVectorStoreAPIUploadLocal:
         assert response.json()["success"] is True
         assert response.json()["total_chunks"] == 3
     
-    def test_upload_zip_file(self, client, mock_pinecone_service, sample_zip_file):
+    @pytest.mark.slow
+    def test_upload_zip_file(self, client, mock_pinecone_service, ingest_results, sample_zip_file):
         """Test uploading a zip file."""
-        mock_pinecone_service.ingest_from_file_content = MagicMock(return_value={
+        ingest_results.append({
             'total_files': 2,
             'total_documents': 2,
             'total_chunks': 4,
@@ -224,9 +268,9 @@ class TestVectorStoreAPIUploadLocal:
         
         assert response.status_code == 503
     
-    def test_upload_file_invalid_file_type(self, client, mock_pinecone_service):
+    def test_upload_file_invalid_file_type(self, client, mock_pinecone_service, ingest_results):
         """Test upload with unsupported file type."""
-        mock_pinecone_service.ingest_from_file_content = MagicMock(side_effect=ValueError("Unsupported file type"))
+        ingest_results.append(ValueError("Unsupported file type"))
         
         response = client.post(
             "/vectorstore/upload",
@@ -240,9 +284,9 @@ class TestVectorStoreAPIUploadLocal:
 class TestVectorStoreAPIIngestion:
     """Tests for ingestion endpoints."""
     
-    def test_ingest_documents_local_path(self, client, mock_pinecone_service):
+    def test_ingest_documents_local_path(self, client, mock_pinecone_service, ingest_results):
         """Test ingestion from local path."""
-        mock_pinecone_service.ingest_documents = MagicMock(return_value={
+        ingest_results.append({
             'total_files': 1,
             'total_documents': 1,
             'total_chunks': 2,
@@ -262,9 +306,9 @@ class TestVectorStoreAPIIngestion:
         assert response.status_code == 201
         assert response.json()["success"] is True
     
-    def test_ingest_documents_s3_url(self, client, mock_pinecone_service):
+    def test_ingest_documents_s3_url(self, client, mock_pinecone_service, ingest_results):
         """Test ingestion from S3 presigned URL."""
-        mock_pinecone_service.ingest_documents = MagicMock(return_value={
+        ingest_results.append({
             'total_files': 1,
             'total_documents': 1,
             'total_chunks': 2,
@@ -284,9 +328,9 @@ class TestVectorStoreAPIIngestion:
         assert response.status_code == 201
         assert response.json()["success"] is True
     
-    def test_ingest_documents_file_not_found(self, client, mock_pinecone_service):
+    def test_ingest_documents_file_not_found(self, client, mock_pinecone_service, ingest_results):
         """Test ingestion when file is not found."""
-        mock_pinecone_service.ingest_documents = MagicMock(side_effect=FileNotFoundError("File not found"))
+        ingest_results.append(FileNotFoundError("File not found"))
         
         response = client.post(
             "/vectorstore/ingest",
@@ -299,9 +343,9 @@ class TestVectorStoreAPIIngestion:
         
         assert response.status_code == 404
     
-    def test_ingest_documents_invalid_source(self, client, mock_pinecone_service):
+    def test_ingest_documents_invalid_source(self, client, mock_pinecone_service, ingest_results):
         """Test ingestion with invalid source."""
-        mock_pinecone_service.ingest_documents = MagicMock(side_effect=ValueError("Invalid source"))
+        ingest_results.append(ValueError("Invalid source"))
         
         response = client.post(
             "/vectorstore/ingest",
@@ -318,16 +362,9 @@ class TestVectorStoreAPIIngestion:
 class TestVectorStoreAPISearch:
     """Tests for search endpoints."""
     
-    def test_search_success(self, client, mock_pinecone_service):
+    def test_search_success(self, client, mock_pinecone_service, search_results, sample_search_docs):
         """Test successful search."""
-        from langchain_core.documents import Document
-        
-        mock_documents = [
-            Document(page_content="Test content 1", metadata={"source": "test1.pdf"}),
-            Document(page_content="Test content 2", metadata={"source": "test2.pdf"})
-        ]
-        
-        mock_pinecone_service.search = MagicMock(return_value=mock_documents)
+        search_results.append(list(sample_search_docs))
         
         response = client.post(
             "/vectorstore/search",
@@ -343,15 +380,9 @@ class TestVectorStoreAPISearch:
         assert response.json()["total_results"] == 2
         assert len(response.json()["results"]) == 2
     
-    def test_search_with_filter(self, client, mock_pinecone_service):
+    def test_search_with_filter(self, client, mock_pinecone_service, search_results, sample_search_docs):
         """Test search with metadata filter."""
-        from langchain_core.documents import Document
-        
-        mock_documents = [
-            Document(page_content="Test content", metadata={"source_file": "test.pdf"})
-        ]
-        
-        mock_pinecone_service.search = MagicMock(return_value=mock_documents)
+        search_results.append(list(sample_search_docs))
         
         response = client.post(
             "/vectorstore/search",
@@ -368,12 +399,9 @@ class TestVectorStoreAPISearch:
         call_args = mock_pinecone_service.search.call_args
         assert call_args[1]['filter'] == {"source_file": "test.pdf"}
     
-    def test_search_without_top_k(self, client, mock_pinecone_service):
+    def test_search_without_top_k(self, client, mock_pinecone_service, search_results, sample_search_docs):
         """Test search without specifying top_k."""
-        from langchain_core.documents import Document
-        
-        mock_documents = [Document(page_content="Test content", metadata={})]
-        mock_pinecone_service.search = MagicMock(return_value=mock_documents)
+        search_results.append(list(sample_search_docs))
         
         response = client.post(
             "/vectorstore/search",
@@ -396,9 +424,9 @@ class TestVectorStoreAPISearch:
         
         assert response.status_code == 503
     
-    def test_search_error(self, client, mock_pinecone_service):
+    def test_search_error(self, client, mock_pinecone_service, search_results):
         """Test search when error occurs."""
-        mock_pinecone_service.search = MagicMock(side_effect=Exception("Search error"))
+        search_results.append(Exception("Search error"))
         
         response = client.post(
             "/vectorstore/search",
@@ -407,6 +435,34 @@ class TestVectorStoreAPISearch:
         )
         
         assert response.status_code == 500
+    
+    def test_batch_search_success(self, client, mock_pinecone_service, sample_search_docs):
+        """Test batch search returns one result set per query, in order."""
+        mock_pinecone_service.search_batch.return_value = [list(sample_search_docs), []]
+        
+        response = client.post(
+            "/vectorstore/search/batch",
+            json={"queries": ["first query", "second query"], "top_k": 5},
+            headers={"Authorization": "Bearer test_token"}
+        )
+        
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["query"] for r in results] == ["first query", "second query"]
+        assert [r["total_results"] for r in results] == [2, 0]
+        assert mock_pinecone_service.search_batch.call_args[1]['queries'] == ["first query", "second query"]
+    
+    def test_batch_search_error(self, client, mock_pinecone_service):
+        """Test batch search when error occurs."""
+        mock_pinecone_service.search_batch.side_effect = Exception("Search error")
+        
+        response = client.post(
+            "/vectorstore/search/batch",
+            json={"queries": ["test query"]},
+            headers={"Authorization": "Bearer test_token"}
+        )
+        
+        assert response.status_code == 500
 
 
 class TestVectorStoreAPINamespaceManagement:
@@ -495,7 +551,9 @@ class TestVectorStoreAPIRoot:
 class TestVectorStoreAPIAuthentication:
     """Tests for authentication scenarios."""
     
-    def test_all_endpoints_require_auth(self, mock_pinecone_service):
+    @pytest.mark.slow
+    @pytest.mark.xdist_group("api_global")
+    async def test_all_endpoints_require_auth(self, mock_pinecone_service):
         """Test that all endpoints require authentication."""
         from VectorStore.jwt_utils import get_current_user
         
@@ -504,34 +562,31 @@ class TestVectorStoreAPIAuthentication:
         
         app.dependency_overrides[get_current_user] = override_get_current_user
         
+        # Test all endpoints require auth
+        endpoints = [
+            ("GET", "/vectorstore/index/stats", {}),
+            ("POST", "/vectorstore/presigned-url", {"json": {"file_name": "test.pdf"}}),
+            ("POST", "/vectorstore/upload", {"files": {"file": ("test.txt", io.BytesIO(b"test"), "text/plain")}}),
+            ("POST", "/vectorstore/process-s3-upload", {"json": {"s3_key": "test.pdf"}}),
+            ("POST", "/vectorstore/ingest", {"json": {"source": "/path/to/file.pdf"}}),
+            ("POST", "/vectorstore/search", {"json": {"query": "test"}}),
+            ("POST", "/vectorstore/search/batch", {"json": {"queries": ["test"]}}),
+            ("DELETE", "/vectorstore/namespace/test", {}),
+        ]
+        
         with patch('VectorStore.vectorstore_api.pinecone_service', mock_pinecone_service):
-            client = TestClient(app)
-            
-            # Test all endpoints require auth
-            endpoints = [
-                ("GET", "/vectorstore/index/stats", None),
-                ("POST", "/vectorstore/presigned-url", {"file_name": "test.pdf"}),
-                ("POST", "/vectorstore/upload", None),
-                ("POST", "/vectorstore/process-s3-upload", {"s3_key": "test.pdf"}),
-                ("POST", "/vectorstore/ingest", {"source": "/path/to/file.pdf"}),
-                ("POST", "/vectorstore/search", {"query": "test"}),
-                ("DELETE", "/vectorstore/namespace/test", None),
-            ]
-            
-            for method, endpoint, data in endpoints:
-                if method == "POST":
-                    if endpoint == "/vectorstore/upload":
-                        response = client.post(endpoint, files={"file": ("test.txt", io.BytesIO(b"test"), "text/plain")})
-                    else:
-                        response = client.post(endpoint, json=data)
-                elif method == "GET":
-                    response = client.get(endpoint)
-                elif method == "DELETE":
-                    response = client.delete(endpoint)
-                
-                assert response.status_code == 401, f"{method} {endpoint} should require auth"
+            # ASGITransport drives the app in-process without running its lifespan
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                responses = await asyncio.gather(*[
+                    client.request(method, endpoint, **kwargs)
+                    for method, endpoint, kwargs in endpoints
+                ])
         
         app.dependency_overrides.clear()
+        
+        for (method, endpoint, _), response in zip(endpoints, responses):
+            assert response.status_code == 401, f"{method} {endpoint} should require auth"
     
     def test_health_check_no_auth_required(self, client, mock_pinecone_service):
         """Test that health check doesn't require authentication."""
@@ -7,179 +7,169 @@ from unittest.mock import MagicMock, patch, Mock, mock_open
 from pathlib import Path
 import tempfile
 import os
+import sys
+import types
 import io
 import zipfile
+import requests
 from langchain_core.documents import Document
 
 from VectorStore.vectorstore_service import PineconeService
-from VectorStore.document_loader import DocumentLoaderFactory
-from tests.VectorStore.conftest import *
+from VectorStore.embedding_cache import CachedEmbeddings
 
 
+def override_config(base, **embedding_overrides):
+    """
+    Return a copy of `base` with keys in models.embedding replaced.
+    
+    Only the dicts along that path are copied; everything else is shared
+    with the session-wide config, so the result must not be mutated further.
+    """
+    return {
+        **base,
+        'models': {
+            **base['models'],
+            'embedding': {**base['models']['embedding'], **embedding_overrides}
+        }
+    }
+
+
+def raiser(exc):
+    """Return a plain callable that raises `exc`, for failures that need no call tracking."""
+    def _raise(*args, **kwargs):
+        raise exc
+    return _raise
+
+
+@pytest.mark.xdist_group(name="init")
 class TestPineconeServiceInitialization:
     """Tests for PineconeService initialization."""
     
-    def test_init_success(self, temp_config_file, mock_pinecone_client, mock_embedding_model, mock_vector_store, mock_s3_client):
+    def test_init_success(self, full_env, patched_service_deps, mock_pinecone_client, mock_embedding_model, mock_vector_store):
         """Test successful initialization."""
-        with patch.dict(os.environ, {
-            'PINECONE_API_KEY': 'test_api_key',
-            'PINECONE_INDEX_NAME': 'test_index',
-            'GEMINI_API_KEY': 'test_gemini_key',
-            'S3_BUCKET_NAME': 'test_bucket',
-            'AWS_ACCESS_KEY_ID': 'test_access_key',
-            'AWS_SECRET_ACCESS_KEY': 'test_secret_key'
-        }), \
-        patch('VectorStore.vectorstore_service.load_config') as mock_load_config, \
-        patch('VectorStore.vectorstore_service.PineconeClient') as mock_pinecone_class, \
-        patch('VectorStore.vectorstore_service.GoogleGenerativeAIEmbeddings') as mock_embeddings_class, \
-        patch('VectorStore.vectorstore_service.PineconeVectorStore') as mock_vector_store_class, \
-        patch('VectorStore.vectorstore_service.boto3.client') as mock_boto3_client:
-            
-            with open(temp_config_file, 'r') as f:
-                import yaml
-                config_data = yaml.safe_load(f)
-            
-            mock_load_config.return_value = config_data
-            mock_pinecone_class.return_value = mock_pinecone_client
-            mock_embeddings_class.return_value = mock_embedding_model
-            mock_vector_store_class.return_value = mock_vector_store
-            mock_boto3_client.return_value = mock_s3_client
-            
-            service = PineconeService()
-            
-            assert service.config is not None
-            assert service.pinecone_api_key == 'test_api_key'
-            assert service.pinecone_index_name == 'test_index'
-            assert service.client == mock_pinecone_client
-            assert service.embedding_model == mock_embedding_model
-            assert service.vector_store == mock_vector_store
-    
-    def test_init_missing_pinecone_api_key(self, temp_config_file):
-        """Test initialization fails when PINECONE_API_KEY is missing."""
-        with patch.dict(os.environ, {}, clear=True), \
-        patch('VectorStore.vectorstore_service.load_config') as mock_load_config:
-            with open(temp_config_file, 'r') as f:
-                import yaml
-                config_data = yaml.safe_load(f)
+        service = PineconeService()
+        
+        assert service.config is not None
+        assert service.pinecone_api_key == 'test_api_key'
+        assert service.pinecone_index_name == 'test_index'
+        assert service.client == mock_pinecone_client
+        assert service.embedding_model == mock_embedding_model
+        assert service.vector_store == mock_vector_store
+    
+    @pytest.mark.parametrize("missing_key", ["PINECONE_API_KEY", "PINECONE_INDEX_NAME"])
+    def test_init_missing_env(self, full_env, config_data, missing_key):
+        """Test initialization fails when a required Pinecone variable is missing."""
+        full_env.delenv(missing_key)
+        
+        with patch('VectorStore.vectorstore_service.load_config') as mock_load_config:
             mock_load_config.return_value = config_data
             
             with pytest.raises(ValueError, match="PINECONE_API_KEY and PINECONE_INDEX_NAME must be set"):
                 PineconeService()
     
-    def test_init_missing_pinecone_index_name(self, temp_config_file):
-        """Test initialization fails when PINECONE_INDEX_NAME is missing."""
-        with patch.dict(os.environ, {'PINECONE_API_KEY': 'test_key'}, clear=True), \
-        patch('VectorStore.vectorstore_service.load_config') as mock_load_config:
-            with open(temp_config_file, 'r') as f:
-                import yaml
-                config_data = yaml.safe_load(f)
-            mock_load_config.return_value = config_data
-            
-            with pytest.raises(ValueError, match="PINECONE_API_KEY and PINECONE_INDEX_NAME must be set"):
-                PineconeService()
+    def test_init_grpc_vector_store(self, full_env, patched_service_deps, config_data, mock_embedding_model):
+        """Test the vector store is built on a gRPC index when use_grpc is enabled."""
+        patched_service_deps.load_config.return_value = {
+            **config_data,
+            'pinecone': {**config_data['pinecone'], 'use_grpc': True}
+        }
+        grpc_module = types.ModuleType('pinecone.grpc')
+        grpc_module.PineconeGRPC = MagicMock()
+        
+        with patch.dict(sys.modules, {'pinecone.grpc': grpc_module}):
+            PineconeService()
+        
+        grpc_module.PineconeGRPC.assert_called_once_with(api_key='test_api_key')
+        grpc_module.PineconeGRPC.return_value.Index.assert_called_once_with('test_index')
+        patched_service_deps.vector_store.assert_called_once_with(
+            index=grpc_module.PineconeGRPC.return_value.Index.return_value,
+            embedding=mock_embedding_model
+        )
     
-    def test_init_s3_client_failure(self, temp_config_file, mock_pinecone_client, mock_embedding_model, mock_vector_store):
+    def test_init_s3_client_failure(self, full_env, patched_service_deps):
         """Test initialization when S3 client fails."""
-        with patch.dict(os.environ, {
-            'PINECONE_API_KEY': 'test_api_key',
-            'PINECONE_INDEX_NAME': 'test_index',
-            'GEMINI_API_KEY': 'test_gemini_key'
-        }), \
-        patch('VectorStore.vectorstore_service.load_config') as mock_load_config, \
-        patch('VectorStore.vectorstore_service.PineconeClient') as mock_pinecone_class, \
-        patch('VectorStore.vectorstore_service.GoogleGenerativeAIEmbeddings') as mock_embeddings_class, \
-        patch('VectorStore.vectorstore_service.PineconeVectorStore') as mock_vector_store_class, \
-        patch('VectorStore.vectorstore_service.boto3.client') as mock_boto3_client:
-            
-            with open(temp_config_file, 'r') as f:
-                import yaml
-                config_data = yaml.safe_load(f)
-            
-            mock_load_config.return_value = config_data
-            mock_pinecone_class.return_value = mock_pinecone_client
-            mock_embeddings_class.return_value = mock_embedding_model
-            mock_vector_store_class.return_value = mock_vector_store
-            mock_boto3_client.side_effect = Exception("S3 connection failed")
-            
-            service = PineconeService()
-            assert service.s3_client is None
+        patched_service_deps.boto3.side_effect = Exception("S3 connection failed")
+        
+        service = PineconeService()
+        assert service.s3_client is None
 
 
+@pytest.mark.xdist_group(name="init")
 class TestPineconeServiceEmbeddingModel:
     """Tests for embedding model initialization."""
     
-    def test_embedding_model_gemini(self, temp_config_file, mock_pinecone_client, mock_vector_store):
-        """Test Gemini embedding model initialization."""
-        with patch.dict(os.environ, {
-            'PINECONE_API_KEY': 'test_api_key',
-            'PINECONE_INDEX_NAME': 'test_index',
-            'GEMINI_API_KEY': 'test_gemini_key'
-        }), \
-        patch('VectorStore.vectorstore_service.load_config') as mock_load_config, \
-        patch('VectorStore.vectorstore_service.PineconeClient') as mock_pinecone_class, \
-        patch('VectorStore.vectorstore_service.GoogleGenerativeAIEmbeddings') as mock_embeddings_class, \
-        patch('VectorStore.vectorstore_service.PineconeVectorStore') as mock_vector_store_class:
-            
-            with open(temp_config_file, 'r') as f:
-                import yaml
-                config_data = yaml.safe_load(f)
-            
-            mock_load_config.return_value = config_data
-            mock_pinecone_class.return_value = mock_pinecone_client
-            mock_embeddings_class.return_value = MagicMock()
-            mock_vector_store_class.return_value = mock_vector_store
-            
+    @pytest.mark.parametrize("provider,embeddings_mock", [
+        ('gemini', 'gemini_embeddings'),
+        ('openai', 'openai_embeddings'),
+    ])
+    def test_embedding_model(self, full_env, patched_service_deps, config_data, provider, embeddings_mock):
+        """Test the embedding model class is chosen from the configured provider."""
+        patched_service_deps.load_config.return_value = override_config(config_data, provider=provider)
+        full_env.setenv('OPENAI_API_KEY', 'test_openai_key')
+        
+        PineconeService()
+        getattr(patched_service_deps, embeddings_mock).assert_called_once()
+    
+    def test_embedding_model_local(self, full_env, patched_service_deps, config_data):
+        """Test the local provider builds a normalized CPU HuggingFace embedding model."""
+        onnx_kwargs = {'backend': 'onnx', 'model_kwargs': {'file_name': 'onnx/model_qint8_avx512_vnni.onnx'}}
+        patched_service_deps.load_config.return_value = override_config(
+            config_data, provider='local', name='BAAI/bge-small-en-v1.5', model_kwargs=onnx_kwargs
+        )
+        embeddings_module = types.ModuleType('langchain_huggingface')
+        embeddings_module.HuggingFaceEmbeddings = MagicMock()
+        
+        with patch.dict(sys.modules, {'langchain_huggingface': embeddings_module}):
             service = PineconeService()
-            mock_embeddings_class.assert_called_once()
-    
-    def test_embedding_model_openai(self, temp_config_file, mock_pinecone_client, mock_vector_store):
-        """Test OpenAI embedding model initialization."""
-        with open(temp_config_file, 'r') as f:
-            import yaml
-            config_data = yaml.safe_load(f)
-        config_data['models']['embedding']['provider'] = 'openai'
-        
-        with patch.dict(os.environ, {
-            'PINECONE_API_KEY': 'test_api_key',
-            'PINECONE_INDEX_NAME': 'test_index',
-            'OPENAI_API_KEY': 'test_openai_key'
-        }), \
-        patch('VectorStore.vectorstore_service.load_config') as mock_load_config, \
-        patch('VectorStore.vectorstore_service.PineconeClient') as mock_pinecone_class, \
-        patch('VectorStore.vectorstore_service.OpenAIEmbeddings') as mock_embeddings_class, \
-        patch('VectorStore.vectorstore_service.PineconeVectorStore') as mock_vector_store_class:
-            
-            mock_load_config.return_value = config_data
-            mock_pinecone_class.return_value = mock_pinecone_client
-            mock_embeddings_class.return_value = MagicMock()
-            mock_vector_store_class.return_value = mock_vector_store
-            
+        
+        embeddings_module.HuggingFaceEmbeddings.assert_called_once_with(
+            model_name='BAAI/bge-small-en-v1.5',
+            model_kwargs={'device': 'cpu', **onnx_kwargs},
+            encode_kwargs={'normalize_embeddings': True}
+        )
+        assert service.embedding_model == embeddings_module.HuggingFaceEmbeddings.return_value
+    
+    def test_embedding_model_local_community_fallback(self, full_env, patched_service_deps, config_data):
+        """Test the local provider falls back to langchain_community without langchain-huggingface."""
+        patched_service_deps.load_config.return_value = override_config(
+            config_data, provider='local', name='BAAI/bge-small-en-v1.5'
+        )
+        embeddings_module = types.ModuleType('langchain_community.embeddings')
+        embeddings_module.HuggingFaceEmbeddings = MagicMock()
+        
+        with patch.dict(sys.modules, {'langchain_huggingface': None, 'langchain_community.embeddings': embeddings_module}):
             service = PineconeService()
-            mock_embeddings_class.assert_called_once()
+        
+        assert service.embedding_model == embeddings_module.HuggingFaceEmbeddings.return_value
     
-    def test_embedding_model_missing_api_key(self, temp_config_file, mock_pinecone_client, mock_vector_store):
+    def test_embedding_model_missing_api_key(self, full_env, patched_service_deps):
         """Test embedding model initialization fails when API key is missing."""
-        with patch.dict(os.environ, {
-            'PINECONE_API_KEY': 'test_api_key',
-            'PINECONE_INDEX_NAME': 'test_index'
-        }, clear=True), \
-        patch('VectorStore.vectorstore_service.load_config') as mock_load_config, \
-        patch('VectorStore.vectorstore_service.PineconeClient') as mock_pinecone_class, \
-        patch('VectorStore.vectorstore_service.PineconeVectorStore') as mock_vector_store_class, \
-        patch('VectorStore.vectorstore_service.GoogleGenerativeAIEmbeddings') as mock_embeddings_class:
-            
-            with open(temp_config_file, 'r') as f:
-                import yaml
-                config_data = yaml.safe_load(f)
-            
-            mock_load_config.return_value = config_data
-            mock_pinecone_class.return_value = mock_pinecone_client
-            mock_vector_store_class.return_value = mock_vector_store
-            # Mock the embedding class to raise ValueError when API key is missing
-            mock_embeddings_class.side_effect = ValueError("GEMINI_API_KEY environment variable not set")
-            
-            with pytest.raises(ValueError, match="GEMINI_API_KEY environment variable not set"):
-                PineconeService()
+        full_env.delenv('GEMINI_API_KEY')
+        # Mock the embedding class to raise ValueError when API key is missing
+        patched_service_deps.gemini_embeddings.side_effect = ValueError("GEMINI_API_KEY environment variable not set")
+        
+        with pytest.raises(ValueError, match="GEMINI_API_KEY environment variable not set"):
+            PineconeService()
+    
+    def test_embedding_cache_enabled(self, full_env, patched_service_deps, config_data, mock_embedding_model, tmp_path):
+        """Test the embedding model is wrapped in the persistent cache when enabled."""
+        cache_path = str(tmp_path / "embeddings.sqlite")
+        patched_service_deps.load_config.return_value = {
+            **config_data,
+            'embedding_cache': {'enabled': True, 'path': cache_path}
+        }
+        
+        service = PineconeService()
+        
+        assert isinstance(service.embedding_model, CachedEmbeddings)
+        assert service.embedding_model.embeddings == mock_embedding_model
+        assert patched_service_deps.vector_store.call_args[1]['embedding'] is service.embedding_model
+        
+        full_env.setenv('DISABLE_EMBEDDING_CACHE', 'false')
+        assert isinstance(PineconeService().embedding_model, CachedEmbeddings)
+        
+        full_env.setenv('DISABLE_EMBEDDING_CACHE', 'true')
+        assert PineconeService().embedding_model == mock_embedding_model
 
 
 class TestPineconeServiceCreateIndex:
@@ -205,7 +195,7 @@ class TestPineconeServiceCreateIndex:
     
     def test_create_index_error(self, vectorstore_service):
         """Test create_index when error occurs."""
-        vectorstore_service.client.list_indexes = MagicMock(side_effect=Exception("Connection error"))
+        vectorstore_service.client.list_indexes = raiser(Exception("Connection error"))
         
         with pytest.raises(Exception, match="Connection error"):
             vectorstore_service.create_index()
@@ -227,7 +217,7 @@ class TestPineconeServiceGetIndexStats:
     
     def test_get_index_stats_error(self, vectorstore_service):
         """Test get_index_stats when error occurs."""
-        vectorstore_service.client.Index = MagicMock(side_effect=Exception("Index error"))
+        vectorstore_service.client.Index = raiser(Exception("Index error"))
         
         with pytest.raises(Exception, match="Index error"):
             vectorstore_service.get_index_stats()
@@ -236,15 +226,16 @@ class TestPineconeServiceGetIndexStats:
 class TestPineconeServiceZipHandling:
     """Tests for zip file handling methods."""
     
-    def test_is_zip_file_by_content(self, vectorstore_service):
-        """Test _is_zip_file with zip content."""
-        zip_content = b'PK\x03\x04'  # ZIP magic bytes
-        assert vectorstore_service._is_zip_file(content=zip_content) is True
-    
-    def test_is_zip_file_by_path(self, vectorstore_service):
-        """Test _is_zip_file with zip file path."""
-        assert vectorstore_service._is_zip_file(file_path="test.zip") is True
-        assert vectorstore_service._is_zip_file(file_path="test.txt") is False
+    @pytest.mark.parametrize("kwargs,expected", [
+        (dict(content=b'PK\x03\x04'), True),  # ZIP magic bytes
+        (dict(content=b'XX'), False),
+        (dict(file_path="test.zip"), True),
+        (dict(file_path="test.txt"), False),
+        (dict(file_path="a.ZIP"), True),
+    ], ids=["zip-bytes", "other-bytes", "zip-path", "txt-path", "upper-zip-path"])
+    def test_is_zip_file(self, vectorstore_service, kwargs, expected):
+        """Test _is_zip_file by magic bytes and by file extension."""
+        assert vectorstore_service._is_zip_file(**kwargs) is expected
     
     def test_extract_zip_success(self, vectorstore_service, sample_zip_file):
         """Test successful zip extraction."""
@@ -267,51 +258,37 @@ class TestPineconeServiceZipHandling:
 class TestPineconeServiceDocumentLoading:
     """Tests for document loading methods."""
     
-    def test_load_documents_from_file(self, vectorstore_service):
+    def test_load_documents_from_file(self, vectorstore_service, patched_loader_factory, tmp_path):
         """Test loading documents from a file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Test content")
-            temp_path = f.name
-        
-        try:
-            with patch('VectorStore.vectorstore_service.DocumentLoaderFactory.get_loader') as mock_get_loader:
-                mock_loader = MagicMock()
-                mock_loader.load = MagicMock(return_value=[
-                    Document(page_content="Test content", metadata={})
-                ])
-                mock_get_loader.return_value = mock_loader
-                
-                docs = vectorstore_service._load_documents_from_file(temp_path)
-                
-                assert len(docs) == 1
-                assert docs[0].page_content == "Test content"
-                assert 'source_file' in docs[0].metadata
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-    
-    def test_get_files_from_directory(self, vectorstore_service):
+        temp_path = tmp_path / "test.txt"
+        temp_path.write_text("Test content")
+        
+        mock_loader = MagicMock()
+        mock_loader.load = MagicMock(return_value=[
+            Document(page_content="Test content", metadata={})
+        ])
+        patched_loader_factory.get_loader.return_value = mock_loader
+        
+        docs = vectorstore_service._load_documents_from_file(str(temp_path))
+        
+        assert len(docs) == 1
+        assert docs[0].page_content == "Test content"
+        assert 'source_file' in docs[0].metadata
+    
+    def test_get_files_from_directory(self, vectorstore_service, fs):
         """Test getting files from directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test files
-            txt_file = os.path.join(temp_dir, "test.txt")
-            pdf_file = os.path.join(temp_dir, "test.pdf")
-            unsupported_file = os.path.join(temp_dir, "test.xyz")
-            
-            with open(txt_file, 'w') as f:
-                f.write("test")
-            with open(pdf_file, 'w') as f:
-                f.write("test")
-            with open(unsupported_file, 'w') as f:
-                f.write("test")
-            
-            files = vectorstore_service._get_files_from_directory(Path(temp_dir))
-            
-            # Should only return supported files
-            assert len(files) >= 2
-            assert any('test.txt' in f for f in files)
-            assert any('test.pdf' in f for f in files)
-            assert not any('test.xyz' in f for f in files)
+        # pyfakefs keeps these files in memory
+        fs.create_file('/fake/test.txt', contents="test")
+        fs.create_file('/fake/test.pdf', contents="test")
+        fs.create_file('/fake/test.xyz', contents="test")
+        
+        files = vectorstore_service._get_files_from_directory(Path('/fake'))
+        
+        # Should only return supported files
+        assert len(files) >= 2
+        assert any('test.txt' in f for f in files)
+        assert any('test.pdf' in f for f in files)
+        assert not any('test.xyz' in f for f in files)
 
 
 class TestPineconeServiceFileContentHandling:
@@ -354,7 +331,6 @@ class TestPineconeServiceDownload:
     def test_download_from_url_error(self, vectorstore_service):
         """Test URL download when error occurs."""
         with patch('VectorStore.vectorstore_service.requests.get') as mock_get:
-            import requests
             mock_get.side_effect = requests.exceptions.RequestException("Download failed")
             
             with pytest.raises(requests.exceptions.RequestException):
@@ -364,13 +340,13 @@ class TestPineconeServiceDownload:
 class TestPineconeServiceIngestion:
     """Tests for document ingestion methods."""
     
-    def test_ingest_documents_to_pinecone_success(self, vectorstore_service, sample_documents):
+    def test_ingest_documents_to_pinecone_success(self, vectorstore_service, patched_loader_factory, sample_documents):
         """Test successful document ingestion."""
-        with patch('VectorStore.vectorstore_service.DocumentLoaderFactory.is_supported') as mock_is_supported, \
-        patch.object(vectorstore_service, '_load_documents_from_file') as mock_load, \
+        patched_loader_factory.is_supported.return_value = True
+        
+        with patch.object(vectorstore_service, '_load_documents_from_file') as mock_load, \
         patch.object(vectorstore_service.text_splitter, 'split_documents') as mock_split:
             
-            mock_is_supported.return_value = True
             mock_load.return_value = sample_documents
             mock_split.return_value = sample_documents
             
@@ -383,65 +359,87 @@ class TestPineconeServiceIngestion:
             assert stats['total_files'] == 1
             assert stats['total_documents'] == 2
             vectorstore_service.vector_store.add_documents.assert_called_once()
+            assert 'async_req' not in vectorstore_service.vector_store.add_documents.call_args[1]
+    
+    def test_ingest_documents_to_pinecone_grpc(self, full_env, patched_service_deps, config_data,
+                                               patched_loader_factory, sample_documents):
+        """Test ingestion upserts synchronously when the store is built on the gRPC index."""
+        patched_service_deps.load_config.return_value = {
+            **config_data,
+            'pinecone': {**config_data['pinecone'], 'use_grpc': True}
+        }
+        patched_loader_factory.is_supported.return_value = True
+        grpc_module = types.ModuleType('pinecone.grpc')
+        grpc_module.PineconeGRPC = MagicMock()
+        
+        with patch.dict(sys.modules, {'pinecone.grpc': grpc_module}):
+            service = PineconeService()
+        
+        with patch.object(service, '_load_documents_from_file', return_value=sample_documents), \
+        patch.object(service.text_splitter, 'split_documents', return_value=sample_documents):
+            stats = service._ingest_documents_to_pinecone(
+                file_paths=["/tmp/test1.pdf"],
+                namespace="test_namespace"
+            )
+        
+        assert stats['success'] is True
+        patched_service_deps.vector_store.return_value.add_documents.assert_called_once_with(
+            documents=sample_documents,
+            namespace="test_namespace",
+            async_req=False
+        )
     
-    def test_ingest_documents_to_pinecone_no_supported_files(self, vectorstore_service):
+    def test_ingest_documents_to_pinecone_no_supported_files(self, vectorstore_service, patched_loader_factory):
         """Test ingestion when no supported files."""
-        with patch('VectorStore.vectorstore_service.DocumentLoaderFactory.is_supported') as mock_is_supported:
-            mock_is_supported.return_value = False
-            
-            with pytest.raises(ValueError, match="No supported files found"):
-                vectorstore_service._ingest_documents_to_pinecone(
-                    file_paths=["/tmp/test.xyz"],
-                    namespace="test_namespace"
-                )
+        patched_loader_factory.is_supported.return_value = False
+        
+        with pytest.raises(ValueError, match="No supported files found"):
+            vectorstore_service._ingest_documents_to_pinecone(
+                file_paths=["/tmp/test.xyz"],
+                namespace="test_namespace"
+            )
     
-    def test_ingest_from_local_path_file(self, vectorstore_service):
+    def test_ingest_from_local_path_file(self, vectorstore_service, tmp_path):
         """Test ingestion from local file path."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Test content")
-            temp_path = f.name
-        
-        try:
-            with patch.object(vectorstore_service, '_ingest_documents_to_pinecone') as mock_ingest:
-                mock_ingest.return_value = {'success': True, 'total_files': 1, 'total_documents': 1, 'total_chunks': 1}
-                
-                stats = vectorstore_service.ingest_from_local_path(temp_path)
-                
-                assert stats['success'] is True
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-    
-    def test_ingest_from_local_path_directory(self, vectorstore_service):
+        temp_path = tmp_path / "test.txt"
+        temp_path.write_text("Test content")
+        
+        with patch.object(vectorstore_service, '_ingest_documents_to_pinecone') as mock_ingest:
+            mock_ingest.return_value = {'success': True, 'total_files': 1, 'total_documents': 1, 'total_chunks': 1}
+            
+            stats = vectorstore_service.ingest_from_local_path(str(temp_path))
+            
+            assert stats['success'] is True
+    
+    def test_ingest_from_local_path_directory(self, vectorstore_service, fs):
         """Test ingestion from local directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            txt_file = os.path.join(temp_dir, "test.txt")
-            with open(txt_file, 'w') as f:
-                f.write("test")
+        fs.create_file('/fake/test.txt', contents="test")
+        
+        with patch.object(vectorstore_service, '_ingest_documents_to_pinecone') as mock_ingest:
+            mock_ingest.return_value = {'success': True, 'total_files': 1, 'total_documents': 1, 'total_chunks': 1}
             
-            with patch.object(vectorstore_service, '_ingest_documents_to_pinecone') as mock_ingest:
-                mock_ingest.return_value = {'success': True, 'total_files': 1, 'total_documents': 1, 'total_chunks': 1}
-                
-                stats = vectorstore_service.ingest_from_local_path(temp_dir)
-                
-                assert stats['success'] is True
+            stats = vectorstore_service.ingest_from_local_path('/fake')
+            
+            assert stats['success'] is True
     
     def test_ingest_from_local_path_zip(self, vectorstore_service, sample_zip_file):
         """Test ingestion from zip file."""
-        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as f:
-            f.write(sample_zip_file)
-            temp_path = f.name
-        
-        try:
-            with patch.object(vectorstore_service, '_ingest_documents_to_pinecone') as mock_ingest:
-                mock_ingest.return_value = {'success': True, 'total_files': 2, 'total_documents': 2, 'total_chunks': 2}
-                
-                stats = vectorstore_service.ingest_from_local_path(temp_path)
-                
-                assert stats['success'] is True
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        def list_zip(zip_content, extract_to):
+            with zipfile.ZipFile(io.BytesIO(zip_content), mode='r') as zip_ref:
+                return zip_ref.namelist()
+        
+        # The archive is served from memory, so nothing is written for it on disk
+        with patch.object(Path, 'exists', return_value=True), \
+        patch.object(Path, 'is_file', return_value=True), \
+        patch('VectorStore.vectorstore_service.open', mock_open(read_data=sample_zip_file), create=True), \
+        patch.object(vectorstore_service, '_extract_zip', side_effect=list_zip), \
+        patch.object(vectorstore_service, '_ingest_documents_to_pinecone') as mock_ingest:
+            mock_ingest.return_value = {'success': True, 'total_files': 2, 'total_documents': 2, 'total_chunks': 2}
+            
+            stats = vectorstore_service.ingest_from_local_path("/sentinel/test.zip")
+            
+            assert stats['success'] is True
+            assert mock_ingest.call_args[1]['file_paths'] == ['test1.txt', 'test2.txt']
     
     def test_ingest_from_file_content(self, vectorstore_service, sample_text_file):
         """Test ingestion from file content."""
@@ -500,22 +498,17 @@ class TestPineconeServiceIngestion:
             
             assert stats['success'] is True
     
-    def test_ingest_documents_universal_local_path(self, vectorstore_service):
+    def test_ingest_documents_universal_local_path(self, vectorstore_service, tmp_path):
         """Test universal ingest_documents with local path."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("Test content")
-            temp_path = f.name
-        
-        try:
-            with patch.object(vectorstore_service, 'ingest_from_local_path') as mock_ingest:
-                mock_ingest.return_value = {'success': True, 'total_files': 1, 'total_documents': 1, 'total_chunks': 1}
-                
-                stats = vectorstore_service.ingest_documents(source=temp_path)
-                
-                assert stats['success'] is True
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        temp_path = tmp_path / "test.txt"
+        temp_path.write_text("Test content")
+        
+        with patch.object(vectorstore_service, 'ingest_from_local_path') as mock_ingest:
+            mock_ingest.return_value = {'success': True, 'total_files': 1, 'total_documents': 1, 'total_chunks': 1}
+            
+            stats = vectorstore_service.ingest_documents(source=str(temp_path))
+            
+            assert stats['success'] is True
 
 
 class TestPineconeServiceSearch:
@@ -562,10 +555,31 @@ class TestPineconeServiceSearch:
     
     def test_search_error(self, vectorstore_service):
         """Test search when error occurs."""
-        vectorstore_service.vector_store.similarity_search = MagicMock(side_effect=Exception("Search error"))
+        vectorstore_service.vector_store.similarity_search = raiser(Exception("Search error"))
         
         with pytest.raises(Exception, match="Search error"):
             vectorstore_service.search(query="test query")
+    
+    def test_search_batch(self, vectorstore_service, sample_search_docs):
+        """Test batch search embeds each text as a query and keeps result order."""
+        vectorstore_service.embedding_model.embed_query = MagicMock(
+            side_effect=lambda query: [0.1] if query == "first query" else [0.2]
+        )
+        vectorstore_service.vector_store.similarity_search_by_vector = MagicMock(
+            side_effect=lambda embedding, **kwargs: [sample_search_docs[0]] if embedding == [0.1] else [sample_search_docs[1]]
+        )
+        
+        results = vectorstore_service.search_batch(["first query", "second query"], top_k=3)
+        
+        assert sorted(call[0][0] for call in vectorstore_service.embedding_model.embed_query.call_args_list) == ["first query", "second query"]
+        vectorstore_service.embedding_model.embed_documents.assert_not_called()
+        assert [docs[0].metadata['source'] for docs in results] == ['test1.pdf', 'test2.pdf']
+        assert vectorstore_service.vector_store.similarity_search_by_vector.call_args[1]['k'] == 3
+    
+    def test_search_batch_empty(self, vectorstore_service):
+        """Test batch search with no queries skips the embedding call."""
+        assert vectorstore_service.search_batch([]) == []
+        vectorstore_service.embedding_model.embed_query.assert_not_called()
 
 
 class TestPineconeServiceNamespaceManagement:
@@ -582,7 +596,7 @@ class TestPineconeServiceNamespaceManagement:
     
     def test_delete_namespace_error(self, vectorstore_service):
         """Test delete_namespace when error occurs."""
-        vectorstore_service.client.Index = MagicMock(side_effect=Exception("Index error"))
+        vectorstore_service.client.Index = raiser(Exception("Index error"))
         
         with pytest.raises(Exception, match="Index error"):
             vectorstore_service.delete_namespace("test_namespace")
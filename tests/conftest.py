@@ -0,0 +1,59 @@
+"""
+Top-level pytest configuration shared by every service test suite.
+
+The unit tests never talk to Pinecone, S3 or Google, and every class pulled
+from those SDKs is patched before use. Importing the real packages still
+drags in grpc, botocore and friends on every test process start, so
+lightweight stub modules are registered in ``sys.modules`` before any
+service module is imported. ``setdefault`` leaves already-imported real
+modules untouched.
+"""
+import sys
+import types
+from unittest.mock import MagicMock
+
+import pytest
+
+
+class _StubClientError(Exception):
+    """Stand-in for botocore.exceptions.ClientError; must stay a real exception type."""
+
+
+_STUB_MODULES = {
+    "pinecone": {"Pinecone": MagicMock(), "ServerlessSpec": MagicMock()},
+    "boto3": {"client": MagicMock()},
+    "botocore": {},
+    "botocore.exceptions": {"ClientError": _StubClientError},
+    "langchain_pinecone": {"PineconeVectorStore": MagicMock()},
+    "langchain_google_genai": {
+        "GoogleGenerativeAIEmbeddings": MagicMock(),
+        "ChatGoogleGenerativeAI": MagicMock(),
+    },
+}
+
+
+for _name, _attributes in _STUB_MODULES.items():
+    _module = types.ModuleType(_name)
+    _module.__dict__.update(_attributes)
+    sys.modules.setdefault(_name, _module)
+
+sys.modules["botocore"].exceptions = sys.modules["botocore.exceptions"]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="Skip tests marked as slow for quicker local iteration."
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--skip-slow"):
+        return
+    
+    skip_slow = pytest.mark.skip(reason="skipped with --skip-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)